@@ -0,0 +1,52 @@
+"""Helpers for running blocking work off the event loop."""
+
+import asyncio
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+# I/O-bound work (downloads, disk scans) shares the loop's default executor.
+THREAD_POOL_SIZE = int(os.getenv("THREAD_POOL_SIZE", "32"))
+
+# CPU-heavy document conversion gets its own pool so long downloads
+# cannot starve it (and vice versa).
+PROCESSING_POOL_SIZE = int(os.getenv("PROCESSING_POOL_SIZE", "2"))
+
+_processing_executor = ThreadPoolExecutor(
+    max_workers=PROCESSING_POOL_SIZE,
+    thread_name_prefix="docling-process",
+)
+
+
+def install_default_executor(loop: asyncio.AbstractEventLoop) -> None:
+    """Replace the loop's default executor with one sized for this app."""
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE, thread_name_prefix="docling")
+    )
+
+
+async def run_blocking(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking callable in the loop's default executor.
+
+    Unlike ``asyncio.to_thread`` this does not copy the contextvars context,
+    which none of our handlers rely on.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, func, *args)
+
+
+async def run_processing(func: Callable[..., T], *args: Any) -> T:
+    """Run a CPU-heavy callable in the dedicated processing executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_processing_executor, func, *args)
+
+
+def submit_processing(func: Callable[..., T], *args: Any) -> "Future[T]":
+    """Submit a CPU-heavy callable to the processing executor.
+
+    Returns the executor's own future, for callers that need to know when
+    the worker thread is really done rather than when an await was cancelled.
+    """
+    return _processing_executor.submit(func, *args)
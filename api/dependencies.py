@@ -1,7 +1,9 @@
 """Singleton dependencies for FastAPI."""
 
+import os
 from functools import lru_cache
 
+from api.concurrency import PROCESSING_POOL_SIZE
 from src.model_manager import ModelManager
 from src.processor import DocumentProcessor
 
@@ -9,7 +11,8 @@ from src.processor import DocumentProcessor
 @lru_cache()
 def get_processor() -> DocumentProcessor:
     """Get singleton DocumentProcessor instance."""
-    return DocumentProcessor()
+    # Conversions run PROCESSING_POOL_SIZE at a time; give each its share of cores
+    return DocumentProcessor(num_threads=max(1, (os.cpu_count() or 1) // PROCESSING_POOL_SIZE))
 
 
 @lru_cache()
@@ -1,36 +1,65 @@
 """FastAPI application factory and static file serving."""
 
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 
+from api.concurrency import install_default_executor, run_blocking
+from api.dependencies import get_model_manager, get_processor
+from api.middleware import UploadSizeLimitMiddleware
 from api.routes import config, health, models, processing
+from api.static import SPAStaticFiles
+from src.config import setup_logging
+
+logger = logging.getLogger("docling-playground.api")
 
 FRONTEND_DIR = Path(__file__).parent.parent / "frontend" / "dist"
 
 
+def _warm_up() -> None:
+    """Create the singletons and load the default pipeline models."""
+    get_model_manager()
+    try:
+        get_processor().warm_up()
+    except Exception as e:
+        # Missing models should not stop the server; /api/process reports them
+        logger.warning(f"Processor warm-up failed: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Configure executors and warm up models before serving requests."""
+    install_default_executor(asyncio.get_running_loop())
+    await run_blocking(_warm_up)
+    yield
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
+    setup_logging()
+
     app = FastAPI(
         title="Docling Playground",
         description="Interactive document processing playground",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
+    # Reject oversized uploads before their bodies are read
+    app.add_middleware(UploadSizeLimitMiddleware)
+
     # Register API routes
     app.include_router(health.router)
     app.include_router(config.router)
     app.include_router(processing.router)
     app.include_router(models.router)
 
-    # Serve React SPA static files (mount AFTER API routes)
+    # Serve React SPA static files from memory (mount AFTER API routes)
     if FRONTEND_DIR.exists():
-        app.mount(
-            "/",
-            StaticFiles(directory=str(FRONTEND_DIR), html=True),
-            name="frontend",
-        )
+        app.mount("/", SPAStaticFiles(FRONTEND_DIR), name="frontend")
 
     return app
 
@@ -0,0 +1,52 @@
+"""ASGI middleware for the API."""
+
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import MAX_UPLOAD_BYTES
+
+
+class UploadSizeLimitMiddleware:
+    """Reject request bodies larger than ``max_bytes`` with a 413.
+
+    A declared Content-Length over the limit is rejected before any of the
+    body is read. Bodies without one (chunked uploads) are counted as they
+    stream in and cut off once they exceed the limit.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int = MAX_UPLOAD_BYTES):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit():
+            if int(content_length) > self.max_bytes:
+                response = JSONResponse(
+                    {"detail": f"Upload exceeds {self.max_bytes} bytes"},
+                    status_code=413,
+                )
+                await response(scope, receive, send)
+                return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Upload exceeds {self.max_bytes} bytes",
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
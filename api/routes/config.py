@@ -1,6 +1,9 @@
 """Configuration endpoint exposing enums, defaults, and language mappings."""
 
-from fastapi import APIRouter
+import hashlib
+
+import orjson
+from fastapi import APIRouter, Request, Response
 
 from src.config import (
     DEFAULT_OPTIONS,
@@ -10,27 +13,34 @@ from src.config import (
     OCRLibrary,
     OutputFormat,
     PipelineType,
+    TableMode,
 )
 
 router = APIRouter(prefix="/api", tags=["config"])
 
+# Display labels per enum; members without an entry get a title-cased value
+_ENUM_LABELS: dict[type, dict[str, str]] = {
+    PipelineType: {"standard": "Standard", "vlm": "VLM"},
+    Accelerator: {"auto": "Auto", "cpu": "CPU", "cuda": "CUDA", "mps": "MPS"},
+    OCRLibrary: {"rapidocr": "RapidOCR", "easyocr": "EasyOCR", "tesseract": "Tesseract"},
+    OutputFormat: {"json": "JSON", "markdown": "Markdown", "summary": "Summary"},
+}
+
 
-def _enum_options(enum_cls, labels: dict[str, str] | None = None):
+def _enum_options(enum_cls) -> list[dict[str, str]]:
     """Convert an enum to a list of {value, label} dicts."""
-    result = []
-    for member in enum_cls:
-        label = labels.get(member.value, member.value.replace("_", " ").title()) if labels else member.value.replace("_", " ").title()
-        result.append({"value": member.value, "label": label})
-    return result
+    labels = _ENUM_LABELS.get(enum_cls, {})
+    return [
+        {
+            "value": member.value,
+            "label": labels.get(member.value) or member.value.replace("_", " ").title(),
+        }
+        for member in enum_cls
+    ]
 
 
-@router.get("/config")
-async def get_config():
-    """Return all configuration enums, defaults, and language mappings."""
-    pipeline_labels = {"standard": "Standard", "vlm": "VLM"}
-    accelerator_labels = {"auto": "Auto", "cpu": "CPU", "cuda": "CUDA", "mps": "MPS"}
-    ocr_labels = {"rapidocr": "RapidOCR", "easyocr": "EasyOCR", "tesseract": "Tesseract"}
-    format_labels = {"json": "JSON", "markdown": "Markdown", "summary": "Summary"}
+def _build_config_payload() -> dict:
+    """Build the static configuration payload served by ``/api/config``."""
 
     ocr_languages = {}
     for lib in OCRLibrary:
@@ -44,11 +54,30 @@ async def get_config():
             defaults[key] = value
 
     return {
-        "pipelines": _enum_options(PipelineType, pipeline_labels),
-        "accelerators": _enum_options(Accelerator, accelerator_labels),
-        "ocr_libraries": _enum_options(OCRLibrary, ocr_labels),
+        "pipelines": _enum_options(PipelineType),
+        "accelerators": _enum_options(Accelerator),
+        "ocr_libraries": _enum_options(OCRLibrary),
+        "table_modes": _enum_options(TableMode),
         "ocr_languages": ocr_languages,
-        "output_formats": _enum_options(OutputFormat, format_labels),
+        "output_formats": _enum_options(OutputFormat),
         "supported_extensions": SUPPORTED_FILE_EXTENSIONS,
         "defaults": defaults,
     }
+
+
+# The payload only depends on module-level constants, so build and
+# serialize it once.
+_CONFIG_PAYLOAD = _build_config_payload()
+_CONFIG_BYTES = orjson.dumps(_CONFIG_PAYLOAD)
+_CONFIG_HEADERS = {
+    "Cache-Control": "public, max-age=3600",
+    "ETag": f'"{hashlib.md5(_CONFIG_BYTES).hexdigest()}"',
+}
+
+
+@router.get("/config")
+async def get_config(request: Request):
+    """Return all configuration enums, defaults, and language mappings."""
+    if request.headers.get("if-none-match") == _CONFIG_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_CONFIG_HEADERS)
+    return Response(content=_CONFIG_BYTES, media_type="application/json", headers=_CONFIG_HEADERS)
@@ -1,16 +1,18 @@
 """Health check endpoint."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from api.dependencies import get_model_manager
+from src.model_manager import ModelManager
 
 router = APIRouter(prefix="/api", tags=["health"])
 
 
 @router.get("/health")
-async def health_check():
+async def health_check(
+    manager: ModelManager = Depends(get_model_manager),
+):
     """Return service health status."""
-    from src.model_manager import ModelManager
-
-    manager = ModelManager()
     return {
         "status": "healthy",
         "version": "0.1.0",
@@ -2,9 +2,14 @@
 
 import asyncio
 import logging
+from collections import deque
+from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 
+from api.concurrency import run_blocking
 from api.dependencies import get_model_manager
 from src.config import disable_offline_mode, enable_offline_mode, get_offline_status
 from src.model_manager import ModelManager
@@ -13,70 +18,169 @@ from src.models import ModelStatus
 logger = logging.getLogger("docling-playground.api.models")
 router = APIRouter(prefix="/api/models", tags=["models"])
 
+# Progress callbacks can fire thousands of times; keep only the tail
+MAX_PROGRESS_MESSAGES = 256
+
+# Number of downloads currently holding offline mode disabled
+_offline_refcount = 0
+
+
+def _begin_download() -> None:
+    """Disable offline mode while any download is in flight.
+
+    Overlapping downloads share one window: the first to begin disables
+    offline mode and only the last to end re-enables it. The counter is
+    only touched on the event loop, so it needs no lock.
+    """
+    global _offline_refcount
+    if _offline_refcount == 0:
+        disable_offline_mode()
+    _offline_refcount += 1
+
+
+def _end_download() -> None:
+    """Release one download's hold on offline mode."""
+    global _offline_refcount
+    _offline_refcount -= 1
+    if _offline_refcount == 0:
+        enable_offline_mode()
+
+
+@asynccontextmanager
+async def _downloads_allowed():
+    """Keep offline mode disabled for the duration of the block."""
+    _begin_download()
+    try:
+        yield
+    finally:
+        _end_download()
+
+
+def _sse_event(data: str, event: str | None = None) -> str:
+    """Format a server-sent event, splitting multi-line data."""
+    lines = [f"event: {event}"] if event else []
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+def _download_finished(job: asyncio.Future) -> None:
+    """Done callback for streamed downloads: release offline mode, log failures."""
+    _end_download()
+    if not job.cancelled() and job.exception() is not None:
+        logger.error(f"Download failed: {job.exception()}")
+
+
+def _stream_progress(func, *args) -> StreamingResponse:
+    """Run a download and stream its progress as server-sent events.
+
+    ``func`` is called with ``*args`` plus a progress callback. Each
+    progress message is sent as a ``data`` event as it happens, followed
+    by a final ``result`` event carrying the JSON-encoded return value,
+    or an ``error`` event with the message if the download raised.
+    Offline mode stays disabled until the download itself finishes, even
+    if the client disconnects and the stream is closed first.
+    """
+
+    async def events():
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[str] = asyncio.Queue()
+
+        def progress_cb(msg: str):
+            loop.call_soon_threadsafe(queue.put_nowait, msg)
+
+        _begin_download()
+        job = asyncio.ensure_future(run_blocking(func, *args, progress_cb))
+        job.add_done_callback(_download_finished)
+
+        next_msg = None
+        try:
+            while not job.done() or not queue.empty():
+                next_msg = asyncio.ensure_future(queue.get())
+                await asyncio.wait({next_msg, job}, return_when=asyncio.FIRST_COMPLETED)
+                if next_msg.done():
+                    yield _sse_event(next_msg.result())
+                else:
+                    next_msg.cancel()
+        finally:
+            # A client that disconnects mid-wait closes the generator here;
+            # don't leave the queue read pending
+            if next_msg is not None and not next_msg.done():
+                next_msg.cancel()
+
+        try:
+            result = job.result()
+        except Exception as e:
+            yield _sse_event(str(e) or type(e).__name__, event="error")
+        else:
+            yield _sse_event(orjson.dumps(result).decode(), event="result")
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
 
 @router.get("", response_model=list[ModelStatus])
 async def list_models(
     manager: ModelManager = Depends(get_model_manager),
 ):
     """Get status of all models."""
-    return await asyncio.to_thread(manager.get_model_status)
+    return await run_blocking(manager.get_model_status)
 
 
 @router.post("/{model_id}/download")
 async def download_model(
     model_id: str,
+    verbose: bool = False,
+    stream: bool = False,
     manager: ModelManager = Depends(get_model_manager),
 ):
-    """Download a specific model by ID."""
-    disable_offline_mode()
-    messages: list[str] = []
+    """Download a specific model by ID.
 
-    def progress_cb(msg: str):
-        messages.append(msg)
+    Progress messages are only returned when ``verbose`` is set, or
+    streamed as server-sent events when ``stream`` is set.
+    """
+    if stream:
+        return _stream_progress(manager.download_model, model_id)
 
-    try:
-        success = await asyncio.to_thread(manager.download_model, model_id, progress_cb)
-        return {"success": success, "message": "; ".join(messages) if messages else None}
-    finally:
-        enable_offline_mode()
+    messages: deque[str] = deque(maxlen=MAX_PROGRESS_MESSAGES)
+    progress_cb = messages.append if verbose else None
+
+    async with _downloads_allowed():
+        success = await run_blocking(manager.download_model, model_id, progress_cb)
+
+    if not verbose:
+        return {"success": success}
+    return {"success": success, "message": "; ".join(messages) if messages else None}
 
 
 @router.post("/download-required")
 async def download_required_models(
+    stream: bool = False,
     manager: ModelManager = Depends(get_model_manager),
 ):
-    """Download all required models."""
-    disable_offline_mode()
-    messages: list[str] = []
+    """Download all required models.
 
-    def progress_cb(msg: str):
-        messages.append(msg)
+    Progress is streamed as server-sent events when ``stream`` is set.
+    """
+    if stream:
+        return _stream_progress(manager.download_required)
 
-    try:
-        results = await asyncio.to_thread(manager.download_required, progress_cb)
-        return results
-    finally:
-        enable_offline_mode()
+    async with _downloads_allowed():
+        return await run_blocking(manager.download_required)
 
 
 @router.post("/download-all")
 async def download_all_models(
+    stream: bool = False,
     manager: ModelManager = Depends(get_model_manager),
 ):
-    """Download all models including optional ones."""
-    disable_offline_mode()
-    messages: list[str] = []
+    """Download all models including optional ones.
 
-    def progress_cb(msg: str):
-        messages.append(msg)
+    Progress is streamed as server-sent events when ``stream`` is set.
+    """
+    if stream:
+        return _stream_progress(manager.download_all, True)
 
-    try:
-        results = await asyncio.to_thread(
-            manager.download_all, True, progress_cb
-        )
-        return results
-    finally:
-        enable_offline_mode()
+    async with _downloads_allowed():
+        return await run_blocking(manager.download_all, True)
 
 
 @router.delete("/cache")
@@ -84,7 +188,7 @@ async def clear_cache(
     manager: ModelManager = Depends(get_model_manager),
 ):
     """Clear the model cache directory."""
-    success = await asyncio.to_thread(manager.clear_cache)
+    success = await run_blocking(manager.clear_cache)
     return {"success": success}
 
 
@@ -93,7 +197,7 @@ async def get_disk_usage(
     manager: ModelManager = Depends(get_model_manager),
 ):
     """Get disk usage of models directory."""
-    usage = await asyncio.to_thread(manager.get_disk_usage)
+    usage = await run_blocking(manager.get_disk_usage)
     return usage
 
 
@@ -106,34 +210,51 @@ async def get_offline_status_endpoint():
 @router.post("/download-easyocr")
 async def download_easyocr_models(
     languages: list[str] = ["en", "ar"],
+    verbose: bool = False,
+    stream: bool = False,
     manager: ModelManager = Depends(get_model_manager),
 ):
-    """Download EasyOCR models for specified languages."""
-    disable_offline_mode()
-    messages: list[str] = []
+    """Download EasyOCR models for specified languages.
+
+    Progress messages are only returned when ``verbose`` is set, or
+    streamed as server-sent events when ``stream`` is set.
+    """
+    if stream:
+        return _stream_progress(manager.download_easyocr_model, languages)
+
+    messages: deque[str] = deque(maxlen=MAX_PROGRESS_MESSAGES)
 
     def progress_cb(msg: str):
         logger.info(msg)
-        messages.append(msg)
+        if verbose:
+            messages.append(msg)
 
-    try:
-        logger.info(f"Downloading EasyOCR models for languages: {languages}")
-        success = await asyncio.to_thread(manager.download_easyocr_model, languages, progress_cb)
-        return {"success": success, "languages": languages, "messages": messages}
-    finally:
-        enable_offline_mode()
+    logger.info(f"Downloading EasyOCR models for languages: {languages}")
+    async with _downloads_allowed():
+        success = await run_blocking(manager.download_easyocr_model, languages, progress_cb)
+
+    if not verbose:
+        return {"success": success, "languages": languages}
+    return {"success": success, "languages": languages, "messages": list(messages)}
 
 
 @router.post("/verify-rapidocr")
 async def verify_rapidocr_models(
+    verbose: bool = False,
     manager: ModelManager = Depends(get_model_manager),
 ):
-    """Verify RapidOCR models are available."""
-    messages: list[str] = []
+    """Verify RapidOCR models are available.
+
+    Progress messages are only returned when ``verbose`` is set.
+    """
+    messages: deque[str] = deque(maxlen=MAX_PROGRESS_MESSAGES)
 
     def progress_cb(msg: str):
         logger.info(msg)
-        messages.append(msg)
+        if verbose:
+            messages.append(msg)
 
-    success = await asyncio.to_thread(manager.download_rapidocr_models, progress_cb)
-    return {"success": success, "messages": messages}
+    success = await run_blocking(manager.download_rapidocr_models, progress_cb)
+    if not verbose:
+        return {"success": success}
+    return {"success": success, "messages": list(messages)}
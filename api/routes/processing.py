@@ -1,19 +1,114 @@
 """Document processing endpoint."""
 
 import asyncio
-import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
+from pydantic import ValidationError
 
+from api.concurrency import PROCESSING_POOL_SIZE, run_blocking, submit_processing
 from api.dependencies import get_processor
+from src.config import SUPPORTED_FILE_EXTENSION_SET
 from src.models import ProcessingOptions, ProcessingResult
 from src.processor import DocumentProcessor
 
 router = APIRouter(prefix="/api", tags=["processing"])
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+DISCONNECT_POLL_SECONDS = 1.0
+
+# Backpressure: documents processed at once, and requests allowed to wait
+MAX_CONCURRENT_DOCS = int(os.getenv("MAX_CONCURRENT_DOCS", str(PROCESSING_POOL_SIZE)))
+MAX_QUEUED_DOCS = int(os.getenv("MAX_QUEUED_DOCS", "8"))
+BUSY_RETRY_AFTER_SECONDS = 5
+
+_processing_slots = asyncio.Semaphore(MAX_CONCURRENT_DOCS)
+_waiting_docs = 0
+
+
+async def _acquire_processing_slot() -> None:
+    """Take one of the MAX_CONCURRENT_DOCS processing slots.
+
+    Once MAX_QUEUED_DOCS requests are already waiting for a slot, new
+    requests are rejected with 503 instead of queueing without bound.
+    The caller must release the slot with ``_processing_slots.release()``.
+    """
+    global _waiting_docs
+    if _processing_slots.locked() and _waiting_docs >= MAX_QUEUED_DOCS:
+        raise HTTPException(
+            status_code=503,
+            detail="Server busy, try again later",
+            headers={"Retry-After": str(BUSY_RETRY_AFTER_SECONDS)},
+        )
+
+    _waiting_docs += 1
+    try:
+        await _processing_slots.acquire()
+    finally:
+        _waiting_docs -= 1
+
+
+def _parse_options(options: str) -> ProcessingOptions:
+    """Validate the options form field."""
+    try:
+        # Parse and validate the JSON in one pass inside pydantic-core
+        parsed_options = ProcessingOptions.model_validate_json(options)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid options: {e}")
+
+    # Lazy outputs are server-side temp files; the response must carry the content
+    if parsed_options.lazy_outputs:
+        raise HTTPException(status_code=422, detail="lazy_outputs is not supported over the API")
+    return parsed_options
+
+
+def _check_extension(filename: str) -> None:
+    """Reject filenames whose extension Docling cannot convert."""
+    suffix = Path(filename).suffix.lower()
+    if suffix not in SUPPORTED_FILE_EXTENSION_SET:
+        raise HTTPException(status_code=400, detail=f"Unsupported file type: {suffix or filename}")
+
+
+def _save_upload(upload: UploadFile) -> Path:
+    """Copy an upload to a named temp file, keeping its extension for format detection."""
+    suffix = Path(upload.filename).suffix
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        shutil.copyfileobj(upload.file, tmp, UPLOAD_CHUNK_SIZE)
+    return Path(tmp.name)
+
+
+async def _process_unless_disconnected(request: Request, cleanup, func, *args):
+    """Run a processing job, returning early with 499 if the client disconnects.
+
+    ``cleanup`` runs once the job no longer needs its resources. A job
+    still queued for a processing worker is dropped and cleaned up at
+    once. A conversion that has already started keeps its thread until it
+    finishes, since threads cannot be interrupted, so cleanup waits for
+    it; only the response returns early.
+    """
+    future = submit_processing(func, *args)
+    try:
+        job = asyncio.wrap_future(future)
+        while True:
+            done, _ = await asyncio.wait({job}, timeout=DISCONNECT_POLL_SECONDS)
+            if done:
+                return job.result()
+            if await request.is_disconnected():
+                raise HTTPException(status_code=499, detail="Client disconnected")
+    finally:
+        if future.done() or future.cancel():
+            cleanup()
+        else:
+            loop = asyncio.get_running_loop()
+            future.add_done_callback(lambda _: loop.call_soon_threadsafe(cleanup))
+
 
 @router.post("/process", response_model=ProcessingResult)
 async def process_document(
+    request: Request,
     file: UploadFile = File(...),
     options: str = Form(default="{}"),
     processor: DocumentProcessor = Depends(get_processor),
@@ -24,18 +119,32 @@ async def process_document(
     - file: The document file to process
     - options: JSON string of ProcessingOptions
     """
-    try:
-        parsed_options = ProcessingOptions(**json.loads(options))
-    except (json.JSONDecodeError, Exception) as e:
-        raise HTTPException(status_code=422, detail=f"Invalid options: {e}")
+    parsed_options = _parse_options(options)
 
     if not file.filename:
         raise HTTPException(status_code=400, detail="No filename provided")
+    _check_extension(file.filename)
+
+    # The slot and the temp file stay held until the conversion thread is
+    # done with them, even if the response goes out early
+    await _acquire_processing_slot()
+    try:
+        # Stream the (already spooled) upload to disk instead of reading it into memory
+        tmp_path = await run_blocking(_save_upload, file)
+    except BaseException:
+        _processing_slots.release()
+        raise
 
-    content = await file.read()
+    def cleanup():
+        tmp_path.unlink(missing_ok=True)
+        _processing_slots.release()
 
-    result = await asyncio.to_thread(
-        processor.process_bytes, content, file.filename, parsed_options
+    if await request.is_disconnected():
+        cleanup()
+        raise HTTPException(status_code=499, detail="Client disconnected")
+    # response_model validates the result and pydantic-core serializes it
+    # straight to JSON bytes
+    return await _process_unless_disconnected(
+        request, cleanup, processor.process_file, tmp_path, parsed_options
     )
 
-    return result
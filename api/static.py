@@ -0,0 +1,110 @@
+"""In-memory static file serving for the React SPA build."""
+
+import gzip
+import hashlib
+import mimetypes
+from dataclasses import dataclass
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import PlainTextResponse, Response
+from starlette.types import Receive, Scope, Send
+
+# Vite emits content-hashed filenames under assets/, so they never change
+IMMUTABLE_PREFIX = "assets/"
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+MIN_COMPRESS_SIZE = 1024
+
+
+@dataclass
+class _Asset:
+    """A file loaded into memory with its precomputed response metadata."""
+
+    body: bytes
+    gzipped: bytes | None
+    media_type: str
+    etag: str
+    cache_control: str
+
+
+class SPAStaticFiles:
+    """Serve a built single-page app from memory.
+
+    Files are read once at construction and compressible ones are gzipped
+    up front, so a request is a dict lookup. Unknown extension-less paths
+    fall back to index.html so client-side routes resolve. Mount at "/".
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self._assets: dict[str, _Asset] = {}
+
+        for path in self.directory.rglob("*"):
+            if path.is_file():
+                rel_path = path.relative_to(self.directory).as_posix()
+                self._assets[rel_path] = self._load(rel_path, path)
+
+    def _load(self, rel_path: str, path: Path) -> _Asset:
+        """Read a file and precompute its headers and gzip variant."""
+        body = path.read_bytes()
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+
+        gzipped = None
+        if len(body) >= MIN_COMPRESS_SIZE and media_type.startswith(COMPRESSIBLE_TYPES):
+            compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                gzipped = compressed
+
+        if rel_path.startswith(IMMUTABLE_PREFIX):
+            cache_control = "public, max-age=31536000, immutable"
+        else:
+            cache_control = "no-cache"
+
+        return _Asset(
+            body=body,
+            gzipped=gzipped,
+            media_type=media_type,
+            etag=f'"{hashlib.md5(body).hexdigest()}"',
+            cache_control=cache_control,
+        )
+
+    def _lookup(self, path: str) -> _Asset | None:
+        """Resolve a request path to an asset, with SPA fallback."""
+        rel_path = path.lstrip("/") or "index.html"
+        asset = self._assets.get(rel_path)
+        if asset is not None:
+            return asset
+
+        # Client-side routes (no file extension) get the app shell
+        if rel_path.startswith("api/") or "." in rel_path.rsplit("/", 1)[-1]:
+            return None
+        return self._assets.get("index.html")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        assert scope["type"] == "http"
+
+        if scope["method"] not in ("GET", "HEAD"):
+            response = PlainTextResponse("Method Not Allowed", status_code=405)
+            await response(scope, receive, send)
+            return
+
+        asset = self._lookup(scope["path"])
+        if asset is None:
+            response = PlainTextResponse("Not Found", status_code=404)
+            await response(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        headers = {"ETag": asset.etag, "Cache-Control": asset.cache_control}
+        if asset.gzipped is not None:
+            headers["Vary"] = "Accept-Encoding"
+
+        if request_headers.get("if-none-match") == asset.etag:
+            response = Response(status_code=304, headers=headers)
+        elif asset.gzipped is not None and "gzip" in request_headers.get("accept-encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            response = Response(asset.gzipped, media_type=asset.media_type, headers=headers)
+        else:
+            response = Response(asset.body, media_type=asset.media_type, headers=headers)
+
+        await response(scope, receive, send)
@@ -194,6 +194,26 @@ export function ProcessingOptions({
               onCheckedChange={(v) => onUpdate("do_table_structure", v)}
             />
           </div>
+          {options.do_table_structure && (
+            <div className="space-y-2">
+              <Label>Table Mode</Label>
+              <Select
+                value={options.table_mode}
+                onValueChange={(v) => onUpdate("table_mode", v)}
+              >
+                <SelectTrigger>
+                  <SelectValue />
+                </SelectTrigger>
+                <SelectContent>
+                  {config?.table_modes.map((m) => (
+                    <SelectItem key={m.value} value={m.value}>
+                      {m.label}
+                    </SelectItem>
+                  ))}
+                </SelectContent>
+              </Select>
+            </div>
+          )}
           <div className="flex items-center justify-between">
             <div className="space-y-0.5">
               <Label>Code Enrichment</Label>
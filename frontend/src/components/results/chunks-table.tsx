@@ -1,9 +1,13 @@
-import { useState } from "react";
+import { useMemo, useState } from "react";
 import { motion, AnimatePresence } from "framer-motion";
-import { ChevronDown, Search } from "lucide-react";
+import { ChevronDown, ChevronLeft, ChevronRight, Search } from "lucide-react";
+import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
 import type { ChunkInfo } from "@/lib/types";
 
+// Only one page of rows is mounted, so large documents stay responsive
+const PAGE_SIZE = 50;
+
 interface ChunksTableProps {
   chunks: ChunkInfo[];
 }
@@ -13,20 +17,39 @@ export function ChunksTable({ chunks }: ChunksTableProps) {
   const [expandedIdx, setExpandedIdx] = useState<number | null>(null);
   const [sortBy, setSortBy] = useState<"index" | "tokens">("index");
   const [sortDir, setSortDir] = useState<"asc" | "desc">("asc");
+  const [page, setPage] = useState(0);
 
-  const filtered = chunks.filter(
-    (c) =>
-      c.text.toLowerCase().includes(search.toLowerCase()) ||
-      String(c.index).includes(search)
+  // Lower-case each chunk once per result rather than on every keystroke
+  const lowered = useMemo(
+    () => chunks.map((c) => c.text.toLowerCase()),
+    [chunks]
   );
 
-  const sorted = [...filtered].sort((a, b) => {
+  // Expanding a row or paging must not re-filter and re-sort everything
+  const sorted = useMemo(() => {
+    const query = search.toLowerCase();
+    const filtered = query
+      ? chunks.filter(
+          (c, i) => lowered[i].includes(query) || String(c.index).includes(search)
+        )
+      : [...chunks];
     const mul = sortDir === "asc" ? 1 : -1;
-    if (sortBy === "index") return (a.index - b.index) * mul;
-    return (a.token_count - b.token_count) * mul;
-  });
+    return filtered.sort((a, b) =>
+      sortBy === "index"
+        ? (a.index - b.index) * mul
+        : (a.token_count - b.token_count) * mul
+    );
+  }, [chunks, lowered, search, sortBy, sortDir]);
+
+  const pageCount = Math.max(1, Math.ceil(sorted.length / PAGE_SIZE));
+  const currentPage = Math.min(page, pageCount - 1);
+  const visible = sorted.slice(
+    currentPage * PAGE_SIZE,
+    (currentPage + 1) * PAGE_SIZE
+  );
 
   const toggleSort = (col: "index" | "tokens") => {
+    setPage(0);
     if (sortBy === col) {
       setSortDir((d) => (d === "asc" ? "desc" : "asc"));
     } else {
@@ -42,7 +65,10 @@ export function ChunksTable({ chunks }: ChunksTableProps) {
         <Input
           placeholder="Search chunks..."
           value={search}
-          onChange={(e) => setSearch(e.target.value)}
+          onChange={(e) => {
+            setSearch(e.target.value);
+            setPage(0);
+          }}
           className="pl-9"
         />
       </div>
@@ -69,7 +95,7 @@ export function ChunksTable({ chunks }: ChunksTableProps) {
             </tr>
           </thead>
           <tbody>
-            {sorted.map((chunk, i) => (
+            {visible.map((chunk, i) => (
               <motion.tr
                 key={chunk.index}
                 initial={{ opacity: 0, x: -10 }}
@@ -126,6 +152,30 @@ export function ChunksTable({ chunks }: ChunksTableProps) {
           </div>
         )}
       </div>
+
+      {pageCount > 1 && (
+        <div className="flex items-center justify-end gap-2 text-sm text-muted-foreground">
+          <span>
+            Page {currentPage + 1} of {pageCount}
+          </span>
+          <Button
+            variant="outline"
+            size="sm"
+            disabled={currentPage === 0}
+            onClick={() => setPage(currentPage - 1)}
+          >
+            <ChevronLeft className="h-4 w-4" />
+          </Button>
+          <Button
+            variant="outline"
+            size="sm"
+            disabled={currentPage >= pageCount - 1}
+            onClick={() => setPage(currentPage + 1)}
+          >
+            <ChevronRight className="h-4 w-4" />
+          </Button>
+        </div>
+      )}
     </div>
   );
 }
@@ -1,4 +1,9 @@
-import { JsonView, darkStyles, defaultStyles } from "react-json-view-lite";
+import {
+  JsonView,
+  collapseAllNested,
+  darkStyles,
+  defaultStyles,
+} from "react-json-view-lite";
 import { useTheme } from "next-themes";
 import "react-json-view-lite/dist/index.css";
 
@@ -14,6 +19,9 @@ export function JsonViewer({ data }: JsonViewerProps) {
     <div className="rounded-lg bg-muted/30 p-4 overflow-auto max-h-[600px] text-sm">
       <JsonView
         data={data}
+        // Expanding everything renders the whole DoclingDocument tree up
+        // front; open only the top level and let the user drill down
+        shouldExpandNode={collapseAllNested}
         style={isDark ? darkStyles : defaultStyles}
       />
     </div>
@@ -4,12 +4,18 @@ import { Copy, Check } from "lucide-react";
 import { Button } from "@/components/ui/button";
 import { useState } from "react";
 
+// Above this size, parsing and rendering markdown stalls the tab, so show
+// the raw text until the user asks for the rendered view
+const RENDER_LIMIT_CHARS = 200_000;
+
 interface MarkdownViewerProps {
   content: string;
 }
 
 export function MarkdownViewer({ content }: MarkdownViewerProps) {
   const [copied, setCopied] = useState(false);
+  const [forceRender, setForceRender] = useState(false);
+  const tooLarge = content.length > RENDER_LIMIT_CHARS && !forceRender;
 
   const handleCopy = async () => {
     await navigator.clipboard.writeText(content);
@@ -31,9 +37,23 @@ export function MarkdownViewer({ content }: MarkdownViewerProps) {
           <Copy className="h-4 w-4" />
         )}
       </Button>
-      <div className="prose prose-sm dark:prose-invert max-w-none p-4 rounded-lg bg-muted/30 overflow-auto max-h-[600px]">
-        <ReactMarkdown remarkPlugins={[remarkGfm]}>{content}</ReactMarkdown>
-      </div>
+      {tooLarge ? (
+        <div className="space-y-2">
+          <div className="flex items-center gap-2 text-sm text-muted-foreground">
+            <span>Large document, showing raw markdown.</span>
+            <Button variant="outline" size="sm" onClick={() => setForceRender(true)}>
+              Render anyway
+            </Button>
+          </div>
+          <pre className="p-4 rounded-lg bg-muted/30 overflow-auto max-h-[600px] text-xs whitespace-pre-wrap">
+            {content}
+          </pre>
+        </div>
+      ) : (
+        <div className="prose prose-sm dark:prose-invert max-w-none p-4 rounded-lg bg-muted/30 overflow-auto max-h-[600px]">
+          <ReactMarkdown remarkPlugins={[remarkGfm]}>{content}</ReactMarkdown>
+        </div>
+      )}
     </div>
   );
 }
@@ -16,11 +16,16 @@ export function useProcessing() {
     ocr_languages: ["en"],
     force_full_page_ocr: false,
     do_table_structure: true,
+    table_mode: "fast",
     do_code_enrichment: false,
     do_formula_enrichment: false,
     do_picture_description: false,
     output_format: "markdown",
+    include_markdown: true,
+    include_json: true,
     chunk_max_tokens: 512,
+    lazy_outputs: false,
+    num_threads: null,
   });
 
   // Apply defaults from config once loaded
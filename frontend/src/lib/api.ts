@@ -40,8 +40,8 @@ export const api = {
     list: () => fetchJSON<ModelStatus[]>(`${BASE}/models`),
 
     download: (modelId: string) =>
-      fetchJSON<{ success: boolean; message: string | null }>(
-        `${BASE}/models/${modelId}/download`,
+      fetchJSON<{ success: boolean; message?: string | null }>(
+        `${BASE}/models/${modelId}/download?verbose=true`,
         { method: "POST" }
       ),
 
@@ -56,7 +56,7 @@ export const api = {
       }),
 
     downloadEasyOCR: (languages: string[] = ["en", "ar"]) =>
-      fetchJSON<{ success: boolean; languages: string[]; messages: string[] }>(
+      fetchJSON<{ success: boolean; languages: string[]; messages?: string[] }>(
         `${BASE}/models/download-easyocr`,
         {
           method: "POST",
@@ -66,7 +66,7 @@ export const api = {
       ),
 
     verifyRapidOCR: () =>
-      fetchJSON<{ success: boolean; messages: string[] }>(
+      fetchJSON<{ success: boolean; messages?: string[] }>(
         `${BASE}/models/verify-rapidocr`,
         { method: "POST" }
       ),
@@ -7,6 +7,7 @@ export interface AppConfig {
   pipelines: EnumOption[];
   accelerators: EnumOption[];
   ocr_libraries: EnumOption[];
+  table_modes: EnumOption[];
   ocr_languages: Record<string, string[]>;
   output_formats: EnumOption[];
   supported_extensions: string[];
@@ -18,11 +19,16 @@ export interface AppConfig {
     ocr_languages: string[];
     force_full_page_ocr: boolean;
     do_table_structure: boolean;
+    table_mode: string;
     do_code_enrichment: boolean;
     do_formula_enrichment: boolean;
     do_picture_description: boolean;
     output_format: string;
+    include_markdown: boolean;
+    include_json: boolean;
     chunk_max_tokens: number;
+    lazy_outputs: boolean;
+    num_threads: number | null;
   };
 }
 
@@ -34,11 +40,16 @@ export interface ProcessingOptions {
   ocr_languages: string[];
   force_full_page_ocr: boolean;
   do_table_structure: boolean;
+  table_mode: string;
   do_code_enrichment: boolean;
   do_formula_enrichment: boolean;
   do_picture_description: boolean;
   output_format: string;
+  include_markdown: boolean;
+  include_json: boolean;
   chunk_max_tokens: number;
+  lazy_outputs: boolean;
+  num_threads: number | null;
 }
 
 export interface ProcessingTiming {
@@ -73,6 +84,8 @@ export interface ProcessingResult {
   error: string | null;
   markdown: string;
   json_data: Record<string, unknown>;
+  markdown_path: string | null;
+  json_path: string | null;
   chunks: ChunkInfo[];
   stats: ProcessingStats;
   timing: ProcessingTiming | null;
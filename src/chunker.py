@@ -1,43 +1,83 @@
 """Document chunking using Docling's HybridChunker."""
 
+from collections import OrderedDict
+
 from docling_core.transforms.chunker import HybridChunker
+from docling_core.transforms.chunker.tokenizer.huggingface import HuggingFaceTokenizer
 from docling_core.types.doc import DoclingDocument
 
 from .models import ChunkInfo
 
+DEFAULT_TOKENIZER = "BAAI/bge-small-en-v1.5"
+
+# chunk_max_tokens comes from the client, so keep only a few chunkers around
+MAX_CACHED_CHUNKERS = 8
+
 
 class DocumentChunker:
     """Wrapper around Docling's HybridChunker."""
 
-    def __init__(self, tokenizer: str = "BAAI/bge-small-en-v1.5"):
+    def __init__(self, tokenizer: str = DEFAULT_TOKENIZER):
         """Initialize chunker with tokenizer.
 
         Args:
             tokenizer: HuggingFace tokenizer name or path
         """
         self._tokenizer = tokenizer
-        self._chunker: HybridChunker | None = None
+        self._hf_tokenizer = None
+        self._chunkers: OrderedDict[int, HybridChunker] = OrderedDict()
 
     def _get_chunker(self, max_tokens: int) -> HybridChunker:
-        """Get or create chunker with specified max tokens."""
-        return HybridChunker(
-            tokenizer=self._tokenizer,
-            max_tokens=max_tokens,
+        """Get or create chunker with specified max tokens.
+
+        The tokenizer is loaded once and shared by every chunker; the
+        MAX_CACHED_CHUNKERS most recently used chunkers are kept.
+        """
+        chunker = self._chunkers.get(max_tokens)
+        if chunker is not None:
+            self._chunkers.move_to_end(max_tokens)
+            return chunker
+
+        if self._hf_tokenizer is None:
+            self._hf_tokenizer = HuggingFaceTokenizer.from_pretrained(model_name=self._tokenizer).get_tokenizer()
+        chunker = HybridChunker(
+            tokenizer=HuggingFaceTokenizer(tokenizer=self._hf_tokenizer, max_tokens=max_tokens),
         )
+        self._chunkers[max_tokens] = chunker
+        if len(self._chunkers) > MAX_CACHED_CHUNKERS:
+            self._chunkers.popitem(last=False)
+        return chunker
 
     def _estimate_tokens(self, text: str) -> int:
         """Estimate token count for text (rough approximation)."""
         # Simple approximation: ~4 characters per token on average
         return len(text) // 4
 
+    def _count_tokens(self, chunker: HybridChunker, texts: list[str]) -> list[int]:
+        """Count tokens for all chunk texts in one batched tokenizer call.
+
+        Falls back to the character-based estimate if the chunker's
+        tokenizer is not a HuggingFace tokenizer.
+        """
+        if not texts:
+            return []
+        try:
+            tokenizer = chunker.tokenizer
+            if hasattr(tokenizer, "get_tokenizer"):
+                tokenizer = tokenizer.get_tokenizer()
+            encoded = tokenizer(texts, add_special_tokens=False, return_length=True)
+            return list(encoded["length"])
+        except Exception:
+            return [self._estimate_tokens(text) for text in texts]
+
     def _get_page_number(self, chunk) -> int | None:
         """Extract page number from chunk metadata if available."""
-        if hasattr(chunk, "meta") and chunk.meta:
-            if hasattr(chunk.meta, "page_no"):
-                return chunk.meta.page_no
-            if isinstance(chunk.meta, dict) and "page_no" in chunk.meta:
-                return chunk.meta["page_no"]
-        return None
+        meta = getattr(chunk, "meta", None)
+        if not meta:
+            return None
+        if isinstance(meta, dict):
+            return meta.get("page_no")
+        return getattr(meta, "page_no", None)
 
     def chunk_document(
         self,
@@ -58,22 +98,25 @@ class DocumentChunker:
         chunker = self._get_chunker(max_tokens)
         chunks = list(chunker.chunk(doc))
 
-        result = []
-        for i, chunk in enumerate(chunks):
-            text = chunk.text if hasattr(chunk, "text") else str(chunk)
+        texts = [chunk.text if hasattr(chunk, "text") else str(chunk) for chunk in chunks]
+        token_counts = self._count_tokens(chunker, texts)
 
+        result = []
+        for i, (chunk, text) in enumerate(zip(chunks, texts)):
             # Create preview (truncated text)
             preview = text[:preview_length]
             if len(text) > preview_length:
                 preview += "..."
 
+            # Every field is produced here with the right type, so skip
+            # per-chunk validation
             result.append(
-                ChunkInfo(
+                ChunkInfo.model_construct(
                     index=i,
                     text=text,
                     preview=preview,
                     page_num=self._get_page_number(chunk),
-                    token_count=self._estimate_tokens(text),
+                    token_count=token_counts[i],
                 )
             )
 
@@ -1,19 +1,32 @@
 """CLI entry point for Docling Playground."""
 
 import os
+import sys
 
 import click
 from rich.console import Console
-from rich.table import Table
 
 console = Console()
 
 
+def _count_true(results: dict[str, bool]) -> int:
+    """Count successful entries in a name -> success mapping."""
+    return sum(results.values())
+
+
 @click.group()
 @click.version_option(version="0.1.0", prog_name="docling-playground")
 def cli():
     """Docling Playground - Interactive document processing."""
-    pass
+    from .config import setup_logging
+
+    setup_logging()
+
+    # Windows consoles default to a legacy code page that can't encode
+    # most document text
+    for stream in (sys.stdout, sys.stderr):
+        if hasattr(stream, "reconfigure"):
+            stream.reconfigure(encoding="utf-8", errors="replace")
 
 
 @cli.group()
@@ -22,6 +35,26 @@ def models():
     pass
 
 
+def _enable_fast_hf_transfer(connections: int | None = None):
+    """Opt into multi-connection HuggingFace downloads.
+
+    Must run before huggingface_hub is imported, since it reads these
+    variables at import time. Explicit user settings are left alone. Large
+    single files such as the VLM weights benefit the most.
+    """
+    os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+    if connections:
+        os.environ["HF_XET_NUM_CONCURRENT_RANGE_GETS"] = str(connections)
+
+    # Older huggingface_hub releases download through hf_transfer instead of
+    # Xet, and refuse to start if it is enabled but not installed
+    try:
+        import hf_transfer  # noqa: F401
+    except ImportError:
+        return
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+
 @models.command("download")
 @click.option(
     "-o", "--output",
@@ -56,12 +89,18 @@ def models():
     default=None,
     help="Specific EasyOCR languages to download (e.g., --easyocr-lang en --easyocr-lang ar)",
 )
+@click.option(
+    "--connections",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Parallel range requests per file (default: huggingface_hub's choice)",
+)
 @click.option(
     "-v", "--verbose",
     is_flag=True,
     help="Enable verbose logging",
 )
-def download(output, download_all, docling, vlm, easyocr, easyocr_lang, verbose):
+def download(output, download_all, docling, vlm, easyocr, easyocr_lang, connections, verbose):
     """Download models to ./models directory for offline use.
 
     By default, downloads only required models.
@@ -78,6 +117,7 @@ def download(output, download_all, docling, vlm, easyocr, easyocr_lang, verbose)
 
     # Disable offline mode for downloads
     disable_offline_mode()
+    _enable_fast_hf_transfer(connections)
 
     manager = ModelManager(models_dir=output)
 
@@ -95,7 +135,7 @@ def download(output, download_all, docling, vlm, easyocr, easyocr_lang, verbose)
         console.print("[bold]Step 1: Checking system cache...[/bold]")
         copy_results = manager.copy_from_cache(progress_callback=progress_callback)
         if copy_results:
-            copied = sum(1 for v in copy_results.values() if v)
+            copied = _count_true(copy_results)
             console.print(f"  [green]Copied {copied}/{len(copy_results)} items from cache[/green]")
         console.print()
 
@@ -129,15 +169,18 @@ def download(output, download_all, docling, vlm, easyocr, easyocr_lang, verbose)
 
     downloaded = False
 
+    # Collect the requested HuggingFace repos and fetch them together
+    hf_repos = []
     if docling:
         console.print("[bold]Downloading Docling core models...[/bold]")
-        manager.download_hf_model("docling-project/docling-layout-heron", progress_callback)
-        manager.download_hf_model("docling-project/docling-models", progress_callback)
-        downloaded = True
+        hf_repos += ["docling-project/docling-layout-heron", "docling-project/docling-models"]
 
     if vlm:
         console.print("[bold]Downloading VLM model (granite-docling-258M)...[/bold]")
-        manager.download_hf_model("ibm-granite/granite-docling-258M", progress_callback)
+        hf_repos.append("ibm-granite/granite-docling-258M")
+
+    if hf_repos:
+        manager.download_hf_models(hf_repos, progress_callback)
         downloaded = True
 
     if easyocr or easyocr_lang:
@@ -150,7 +193,7 @@ def download(output, download_all, docling, vlm, easyocr, easyocr_lang, verbose)
         # Download required by default
         console.print("[bold]Downloading required models...[/bold]")
         results = manager.download_required(progress_callback=progress_callback)
-        success_count = sum(1 for v in results.values() if v)
+        success_count = _count_true(results)
         console.print(f"[green]Downloaded {success_count}/{len(results)} required models[/green]")
 
     # Re-enable offline mode
@@ -172,7 +215,7 @@ def copy_from_cache():
 
     results = manager.copy_from_cache(progress_callback=progress_callback)
 
-    success_count = sum(1 for v in results.values() if v)
+    success_count = _count_true(results)
     console.print()
     console.print(f"[green]Copied {success_count}/{len(results)} items[/green]")
 
@@ -186,6 +229,8 @@ def copy_from_cache():
 )
 def status(output):
     """Show status of downloaded models."""
+    from rich.table import Table
+
     from .model_manager import ModelManager
 
     manager = ModelManager(models_dir=output)
@@ -201,10 +246,17 @@ def status(output):
     table.add_column("Size", justify="right")
     table.add_column("Required", justify="center")
 
-    for s in statuses:
-        status_str = "[green]Ready[/green]" if s.downloaded else "[red]Missing[/red]"
-        required_str = "[yellow]Yes[/yellow]" if s.required else "No"
-        table.add_row(s.name, status_str, f"{s.size_mb}MB", required_str)
+    rows = [
+        (
+            s.name,
+            "[green]Ready[/green]" if s.downloaded else "[red]Missing[/red]",
+            f"{s.size_mb}MB",
+            "[yellow]Yes[/yellow]" if s.required else "No",
+        )
+        for s in statuses
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -218,9 +270,11 @@ def status(output):
 
     # Summary
     console.print()
-    ready_count = sum(1 for s in statuses if s.downloaded)
-    required_ready = sum(1 for s in statuses if s.downloaded and s.required)
-    required_total = sum(1 for s in statuses if s.required)
+    ready_count = required_ready = required_total = 0
+    for s in statuses:
+        ready_count += s.downloaded
+        required_total += s.required
+        required_ready += s.downloaded and s.required
 
     console.print(f"Total: {ready_count}/{len(statuses)} models ready")
     console.print(f"Required: {required_ready}/{required_total} ready")
@@ -243,6 +297,25 @@ def clear():
         console.print("[red]Failed to clear cache[/red]")
 
 
+def _run_streaming(cmd: list[str], cwd) -> int:
+    """Run a command, echoing its combined output line by line as it arrives."""
+    import subprocess
+
+    proc = subprocess.Popen(
+        cmd,
+        cwd=str(cwd),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+        bufsize=1,
+    )
+    with proc.stdout:
+        for line in proc.stdout:
+            console.print(f"  {line.rstrip()}", style="dim", markup=False, highlight=False)
+    return proc.wait()
+
+
 @cli.command("serve")
 @click.option(
     "--host",
@@ -269,7 +342,6 @@ def clear():
 )
 def serve_app(host: str, port: int, build: bool, dev: bool):
     """Start the FastAPI + React playground server."""
-    import subprocess
     import uvicorn
     from pathlib import Path
 
@@ -287,29 +359,15 @@ def serve_app(host: str, port: int, build: bool, dev: bool):
 
         if not (frontend_dir / "node_modules").exists():
             console.print("[yellow]Installing frontend dependencies...[/yellow]")
-            result = subprocess.run(
-                ["npm", "install"],
-                cwd=str(frontend_dir),
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
-                console.print(f"[red]npm install failed:[/red] {result.stderr}")
+            returncode = _run_streaming(["npm", "install"], frontend_dir)
+            if returncode != 0:
+                console.print(f"[red]npm install failed (exit code {returncode})[/red]")
                 return
 
         console.print("[yellow]Building frontend...[/yellow]")
-        result = subprocess.run(
-            ["npm", "run", "build"],
-            cwd=str(frontend_dir),
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            console.print(f"[red]Build failed![/red]")
-            if result.stdout:
-                console.print(result.stdout)
-            if result.stderr:
-                console.print(result.stderr)
+        returncode = _run_streaming(["npm", "run", "build"], frontend_dir)
+        if returncode != 0:
+            console.print(f"[red]Build failed! (exit code {returncode})[/red]")
             return
         console.print("[green]Frontend built successfully![/green]")
 
@@ -367,14 +425,16 @@ def process(file, output, ocr, ocr_library):
 
     # Display output based on format
     if output == "markdown":
-        # Use print with errors='replace' to handle Unicode on Windows
-        try:
-            console.print(result.markdown)
-        except UnicodeEncodeError:
-            print(result.markdown.encode('utf-8', errors='replace').decode('utf-8'))
+        console.print(result.markdown)
     elif output == "json":
-        import json
-        console.print(json.dumps(result.json_data, indent=2, ensure_ascii=False))
+        import orjson
+
+        # Write UTF-8 bytes straight to stdout rather than building a
+        # pretty-printed str and passing it through rich
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(result.json_data, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
     else:  # summary
         console.print(f"Pages: {result.stats.num_pages}")
         console.print(f"Tables: {result.stats.num_tables}")
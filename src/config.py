@@ -5,11 +5,6 @@ import os
 from enum import Enum
 from pathlib import Path
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(name)s: %(message)s"
-)
 logger = logging.getLogger("docling-playground")
 
 # Project root directory
@@ -22,12 +17,20 @@ EASYOCR_MODELS_DIR = MODELS_DIR / "easyocr"
 RAPIDOCR_MODELS_DIR = MODELS_DIR / "rapidocr"
 
 
+def setup_logging():
+    """Configure root logging for the CLI and API entry points."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(name)s: %(message)s"
+    )
+
+
 def setup_model_directories():
     """Set up model directories and cache paths (but not offline mode)."""
-    # Create directories if they don't exist
-    MODELS_DIR.mkdir(parents=True, exist_ok=True)
-    HUGGINGFACE_MODELS_DIR.mkdir(parents=True, exist_ok=True)
-    EASYOCR_MODELS_DIR.mkdir(parents=True, exist_ok=True)
+    # Create directories if they don't exist (MODELS_DIR comes with them)
+    for directory in (HUGGINGFACE_MODELS_DIR, EASYOCR_MODELS_DIR):
+        if not directory.is_dir():
+            directory.mkdir(parents=True, exist_ok=True)
 
     # Set HuggingFace cache to local models directory
     os.environ["HF_HOME"] = str(HUGGINGFACE_MODELS_DIR)
@@ -77,8 +80,11 @@ def get_offline_status() -> dict:
     }
 
 
-# Auto-setup model directories on import (but don't set offline mode yet)
-setup_model_directories()
+# Auto-setup model directories on import (but don't set offline mode yet).
+# The cache variables must be in place before huggingface_hub is imported,
+# so this stays import-time; tooling can opt out.
+if os.environ.get("DOCLING_PLAYGROUND_AUTO_SETUP", "1") == "1":
+    setup_model_directories()
 
 
 class Accelerator(str, Enum):
@@ -101,6 +107,12 @@ class OCRLibrary(str, Enum):
     EASYOCR = "easyocr"
 
 
+class TableMode(str, Enum):
+    """TableFormer model variants."""
+    FAST = "fast"
+    ACCURATE = "accurate"
+
+
 class OutputFormat(str, Enum):
     """Output format options."""
     JSON = "json"
@@ -114,11 +126,16 @@ DEFAULT_ARTIFACTS_PATH = os.environ.get(
     os.path.expanduser("~/.cache/docling/models")
 )
 
-# Supported file extensions
-SUPPORTED_FILE_EXTENSIONS = [
+# Supported file extensions, in display order
+SUPPORTED_FILE_EXTENSIONS = (
     ".pdf", ".docx", ".pptx", ".html", ".htm",
     ".png", ".jpg", ".jpeg", ".tiff", ".tif", ".bmp"
-]
+)
+# For membership checks
+SUPPORTED_FILE_EXTENSION_SET = frozenset(SUPPORTED_FILE_EXTENSIONS)
+
+# Largest document accepted, whether uploaded or fetched from a URL
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(100 * 1024 * 1024)))
 
 # OCR language options per library
 OCR_LANGUAGES = {
@@ -206,9 +223,14 @@ DEFAULT_OPTIONS = {
     "ocr_languages": ["en"],
     "force_full_page_ocr": False,
     "do_table_structure": True,
+    "table_mode": TableMode.FAST,
     "do_code_enrichment": False,
     "do_formula_enrichment": False,
     "do_picture_description": False,
     "output_format": OutputFormat.MARKDOWN,
+    "include_markdown": True,
+    "include_json": True,
     "chunk_max_tokens": 512,
+    "lazy_outputs": False,
+    "num_threads": None,  # None lets the processor pick (cores / concurrent conversions)
 }
@@ -3,6 +3,9 @@
 import logging
 import os
 import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .config import (
@@ -18,6 +21,138 @@ from .models import ModelStatus
 
 logger = logging.getLogger("docling-playground.models")
 
+# Default (per-user) cache locations used outside this project
+_DEFAULT_HF_CACHE = Path.home() / ".cache" / "huggingface" / "hub"
+_DEFAULT_EASYOCR_DIR = Path.home() / ".EasyOCR" / "model"
+
+# HuggingFace repo downloads are network-bound and independent
+MAX_DOWNLOAD_WORKERS = 4
+
+# Concurrent copies in copy_from_cache
+MAX_COPY_WORKERS = min(8, os.cpu_count() or 4)
+
+# MODELS_INFO flattened once for the status scan:
+# (id, name, description, size_mb, required, hf_repo, subfolder, ocr_library, language)
+_MODEL_ENTRIES = tuple(
+    (
+        model_id,
+        info["name"],
+        info["description"],
+        info["size_mb"],
+        info["required"],
+        info.get("hf_repo"),
+        info.get("subfolder"),
+        info.get("ocr_library"),
+        info.get("language"),
+    )
+    for model_id, info in MODELS_INFO.items()
+)
+
+# MODELS_INFO ids partitioned by category, in MODELS_INFO order
+_REQUIRED_MODEL_IDS = tuple(model_id for model_id, info in MODELS_INFO.items() if info["required"])
+_HF_MODEL_IDS = tuple(model_id for model_id, info in MODELS_INFO.items() if info.get("hf_repo"))
+_EASYOCR_MODEL_IDS = tuple(
+    model_id for model_id, info in MODELS_INFO.items()
+    if info.get("ocr_library") == OCRLibrary.EASYOCR
+)
+
+# clear_cache renames the models dir to <name><suffix><id> before deleting it
+_TRASH_SUFFIX = ".deleting-"
+
+# Linux ioctl that clones a file's extents (reflink) on CoW filesystems
+_FICLONE = 0x40049409
+
+# Model status only changes through this class (or a manual copy), so a
+# short TTL is enough to absorb repeated polling from the UI
+STATUS_CACHE_TTL_SECONDS = 10.0
+
+
+def _tree_size(root: Path) -> int:
+    """Total size of regular files under root, in bytes.
+
+    Uses scandir so each entry costs at most one stat. Symlinks are not
+    followed, so HF snapshot links aren't counted on top of their blobs.
+    """
+    total = 0
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
+
+def _fast_copy(src, dst):
+    """Copy a file's contents, keeping the data transfer in the kernel.
+
+    On Linux, first try a FICLONE reflink, which shares the blocks
+    copy-on-write on btrfs/XFS in constant time. Then try copy_file_range,
+    which copies in-kernel. Where neither applies, fall back to
+    shutil.copyfile. Timestamps, permissions and xattrs are not copied;
+    model caches don't need them.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                try:
+                    import fcntl
+
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                    remaining = 0
+                except OSError:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return dst
+        except OSError:
+            pass
+    return shutil.copyfile(src, dst)
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Modification time of path in ns, or None if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _list_names(path: Path) -> frozenset[str]:
+    """Non-hidden entry names in a directory (what a "*" glob would match)."""
+    try:
+        return frozenset(name for name in os.listdir(path) if not name.startswith("."))
+    except OSError:
+        return frozenset()
+
+
+def _remove_trash(models_dir: Path):
+    """Delete every renamed-aside copy of models_dir, including stale ones."""
+    for trash in models_dir.parent.glob(f"{models_dir.name}{_TRASH_SUFFIX}*"):
+        shutil.rmtree(trash, ignore_errors=True)
+
+
+def _has_entries(path: str) -> bool:
+    """True if path is a directory with at least one entry."""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except OSError:
+        return False
+
+
+def _copy_tree(src, dst):
+    """copytree using _fast_copy for each file."""
+    return shutil.copytree(src, dst, copy_function=_fast_copy)
+
 
 class ModelManager:
     """Manages model downloads and offline mode."""
@@ -36,14 +171,32 @@ class ModelManager:
         self.huggingface_dir = self.models_dir / "huggingface"
         self.easyocr_dir = self.models_dir / "easyocr"
 
-        # Create directories
-        self.models_dir.mkdir(parents=True, exist_ok=True)
-        self.huggingface_dir.mkdir(parents=True, exist_ok=True)
-        self.easyocr_dir.mkdir(parents=True, exist_ok=True)
+        # Directories this manager has already created or seen to exist
+        self._ensured_dirs: set[Path] = set()
+
+        # Create directories (models_dir comes with them)
+        self._ensure_dir(self.huggingface_dir)
+        self._ensure_dir(self.easyocr_dir)
 
         # For display in UI
         self.artifacts_path = str(self.models_dir)
 
+        # (timestamp, statuses) of the last status scan
+        self._status_cache: tuple[float, list[ModelStatus]] | None = None
+        self._status_generation = 0
+        # ((hub dir, mtime_ns), repo ids) of the last HF cache scan
+        self._hf_scan_cache: tuple[tuple[Path, int], frozenset[str]] | None = None
+        # (dir mtimes, names) of the last EasyOCR directory listing
+        self._easyocr_names_cache = None
+        # root -> (mtime_ns, size) of the last directory size walk
+        self._disk_usage_cache: dict[Path, tuple[int, int]] = {}
+
+    def _ensure_dir(self, path: Path):
+        """mkdir -p, skipped for directories this manager already made."""
+        if path not in self._ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(path)
+
     def setup_environment(self):
         """Set up environment variables to use local models."""
         os.environ["HF_HOME"] = str(self.huggingface_dir)
@@ -51,44 +204,79 @@ class ModelManager:
         os.environ["TRANSFORMERS_CACHE"] = str(self.huggingface_dir / "transformers")
         os.environ["EASYOCR_MODULE_PATH"] = str(self.easyocr_dir)
 
+    def _downloaded_hf_repos(self) -> frozenset[str]:
+        """Repo ids with a downloaded snapshot in the HF cache.
+
+        The cache is scanned once and reused until the hub directory's
+        mtime changes (a repo added or removed) or the status cache is
+        invalidated.
+        """
+        # Check in local models directory, else the default HF cache
+        hub_cache = self.huggingface_dir / "hub"
+        if not hub_cache.exists():
+            hub_cache = _DEFAULT_HF_CACHE
+        try:
+            key = (hub_cache, hub_cache.stat().st_mtime_ns)
+        except OSError:
+            return frozenset()
+
+        cached = self._hf_scan_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # A repo counts as present once it has a snapshot. Probing the
+        # directories avoids scan_cache_dir, which stats every blob and
+        # resolves every symlink in the cache.
+        repos = set()
+        try:
+            with os.scandir(hub_cache) as entries:
+                for entry in entries:
+                    if entry.name.startswith("models--") and _has_entries(
+                        os.path.join(entry.path, "snapshots")
+                    ):
+                        repos.add(entry.name[len("models--"):].replace("--", "/"))
+        except OSError:
+            return frozenset()
+
+        self._hf_scan_cache = (key, frozenset(repos))
+        return self._hf_scan_cache[1]
+
     def _check_hf_model_exists(self, repo_id: str, subfolder: str | None = None) -> bool:
         """Check if a HuggingFace model is cached locally."""
-        try:
-            from huggingface_hub import scan_cache_dir
-
-            # Check in local models directory
-            hub_cache = self.huggingface_dir / "hub"
-            if not hub_cache.exists():
-                # Also check default HF cache
-                default_cache = Path.home() / ".cache" / "huggingface" / "hub"
-                if not default_cache.exists():
-                    return False
-                cache_info = scan_cache_dir(default_cache)
-            else:
-                cache_info = scan_cache_dir(hub_cache)
+        return repo_id in self._downloaded_hf_repos()
 
-            for repo in cache_info.repos:
-                if repo.repo_id == repo_id:
-                    return repo.size_on_disk > 0
-            return False
-        except Exception:
-            return False
+    def _easyocr_file_names(self) -> tuple[frozenset[str] | None, frozenset[str] | None]:
+        """File names in the local and default EasyOCR dirs (None if missing).
+
+        Both directories are listed once and reused until either mtime
+        changes or the status cache is invalidated.
+        """
+        dirs = (self.easyocr_dir, _DEFAULT_EASYOCR_DIR)
+        key = tuple(_mtime_ns(d) for d in dirs)
+        cached = self._easyocr_names_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        names = tuple(
+            None if mtime is None else _list_names(d)
+            for d, mtime in zip(dirs, key)
+        )
+        self._easyocr_names_cache = (key, names)
+        return names
 
     def _check_easyocr_model_exists(self, language: str | None = None) -> bool:
         """Check if EasyOCR model files exist."""
+        local_names, default_names = self._easyocr_file_names()
+
         # Check local easyocr directory first
-        if self.easyocr_dir.exists():
-            if language:
-                model_files = list(self.easyocr_dir.glob(f"*{language}*"))
-                if len(model_files) > 0:
-                    return True
+        if local_names is not None and language:
+            if any(language in name for name in local_names):
+                return True
 
         # Also check default EasyOCR path
-        default_path = Path.home() / ".EasyOCR" / "model"
-        if default_path.exists():
+        if default_names is not None:
             if language:
-                model_files = list(default_path.glob(f"*{language}*"))
-                return len(model_files) > 0
+                return any(language in name for name in default_names)
             return True
 
         return False
@@ -118,37 +306,54 @@ class ModelManager:
 
         return False
 
+    def invalidate_status_cache(self):
+        """Drop cached status and disk scans so the next calls rescan the disk."""
+        self._status_generation += 1
+        self._status_cache = None
+        self._hf_scan_cache = None
+        self._easyocr_names_cache = None
+        self._disk_usage_cache = {}
+
     def get_model_status(self) -> list[ModelStatus]:
-        """Get status of all models."""
+        """Get status of all models, cached for STATUS_CACHE_TTL_SECONDS."""
+        cached = self._status_cache
+        if cached is not None and time.monotonic() - cached[0] < STATUS_CACHE_TTL_SECONDS:
+            return list(cached[1])
+
+        # A download finishing mid-scan bumps the generation; don't cache
+        # a result that may predate it
+        generation = self._status_generation
+        statuses = self._scan_model_status()
+        if generation == self._status_generation:
+            self._status_cache = (time.monotonic(), statuses)
+        return list(statuses)
+
+    def _scan_model_status(self) -> list[ModelStatus]:
+        """Check every known model on disk."""
         statuses = []
 
-        for model_id, info in MODELS_INFO.items():
+        for (model_id, name, description, size_mb, required,
+             hf_repo, subfolder, ocr_library, language) in _MODEL_ENTRIES:
             downloaded = False
             path = None
 
-            if info.get("hf_repo"):
-                downloaded = self._check_hf_model_exists(
-                    info["hf_repo"],
-                    info.get("subfolder"),
-                )
+            if hf_repo:
+                downloaded = self._check_hf_model_exists(hf_repo, subfolder)
                 if downloaded:
-                    path = f"HF: {info['hf_repo']}"
+                    path = f"HF: {hf_repo}"
 
-            elif info.get("ocr_library"):
-                downloaded = self._check_ocr_model_exists(
-                    info["ocr_library"],
-                    info.get("language"),
-                )
+            elif ocr_library:
+                downloaded = self._check_ocr_model_exists(ocr_library, language)
                 if downloaded:
-                    path = f"OCR: {info['ocr_library'].value}"
+                    path = f"OCR: {ocr_library.value}"
 
             statuses.append(
-                ModelStatus(
+                ModelStatus.model_construct(
                     id=model_id,
-                    name=info["name"],
-                    description=info["description"],
-                    size_mb=info["size_mb"],
-                    required=info["required"],
+                    name=name,
+                    description=description,
+                    size_mb=size_mb,
+                    required=required,
                     downloaded=downloaded,
                     path=path,
                 )
@@ -158,22 +363,15 @@ class ModelManager:
 
     def get_model_table_data(self) -> list[list[str]]:
         """Get model status as table data for Gradio."""
-        statuses = self.get_model_status()
-        data = []
-
-        for status in statuses:
-            status_str = "Ready" if status.downloaded else "Missing"
-            size_str = f"{status.size_mb}MB"
-            action = "Downloaded" if status.downloaded else "Download"
-
-            data.append([
+        return [
+            [
                 status.name,
-                status_str,
-                size_str,
-                action,
-            ])
-
-        return data
+                "Ready" if status.downloaded else "Missing",
+                f"{status.size_mb}MB",
+                "Downloaded" if status.downloaded else "Download",
+            ]
+            for status in self.get_model_status()
+        ]
 
     def download_hf_model(self, repo_id: str, progress_callback=None) -> bool:
         """Download a HuggingFace model to local directory.
@@ -189,7 +387,7 @@ class ModelManager:
 
             # Download to local huggingface directory
             cache_dir = self.huggingface_dir / "hub"
-            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(cache_dir)
 
             logger.info(f"Cache directory: {cache_dir}")
             logger.info(f"Offline mode: {is_offline_mode()}")
@@ -199,6 +397,7 @@ class ModelManager:
                 cache_dir=str(cache_dir),
             )
 
+            self.invalidate_status_cache()
             logger.info(f"Successfully downloaded: {repo_id}")
             if progress_callback:
                 progress_callback(f"Downloaded {repo_id}")
@@ -211,6 +410,31 @@ class ModelManager:
                 progress_callback(f"Failed to download {repo_id}: {e}")
             return False
 
+    def download_hf_models(self, repo_ids: list[str], progress_callback=None) -> dict[str, bool]:
+        """Download several HuggingFace repos concurrently.
+
+        On Ctrl+C, repos that have not started yet are cancelled; downloads
+        already in flight finish before the interpreter exits.
+        """
+        if not repo_ids:
+            return {}
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(MAX_DOWNLOAD_WORKERS, len(repo_ids)),
+            thread_name_prefix="hf-download",
+        )
+        try:
+            futures = {
+                repo_id: executor.submit(self.download_hf_model, repo_id, progress_callback)
+                for repo_id in repo_ids
+            }
+            return {repo_id: future.result() for repo_id, future in futures.items()}
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
     def download_easyocr_model(self, languages: list[str], progress_callback=None) -> bool:
         """Download EasyOCR models to local directory."""
         try:
@@ -219,7 +443,7 @@ class ModelManager:
                 progress_callback(f"Downloading EasyOCR models for {languages}...")
 
             # Ensure directory exists
-            self.easyocr_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(self.easyocr_dir)
 
             # Set environment to use local directory
             os.environ["EASYOCR_MODULE_PATH"] = str(self.easyocr_dir)
@@ -242,6 +466,7 @@ class ModelManager:
                 verbose=True,  # Enable verbose to see download progress
             )
 
+            self.invalidate_status_cache()
             logger.info(f"EasyOCR models downloaded successfully for: {languages}")
             if progress_callback:
                 progress_callback(f"EasyOCR models downloaded for {languages}")
@@ -317,17 +542,16 @@ class ModelManager:
         return False
 
     def download_all_hf_models(self, progress_callback=None) -> dict[str, bool]:
-        """Download all HuggingFace models."""
-        results = {}
-
-        for model_id, info in MODELS_INFO.items():
-            if info.get("hf_repo"):
-                if progress_callback:
-                    progress_callback(f"Downloading {info['name']}...")
-                success = self.download_hf_model(info["hf_repo"], progress_callback)
-                results[model_id] = success
+        """Download all HuggingFace models concurrently."""
+        repos = {}
+        for model_id in _HF_MODEL_IDS:
+            info = MODELS_INFO[model_id]
+            if progress_callback:
+                progress_callback(f"Downloading {info['name']}...")
+            repos[model_id] = info["hf_repo"]
 
-        return results
+        downloaded = self.download_hf_models(list(repos.values()), progress_callback)
+        return {model_id: downloaded[repo_id] for model_id, repo_id in repos.items()}
 
     def download_all_easyocr_models(self, languages: list[str] = None, progress_callback=None) -> bool:
         """Download all EasyOCR models."""
@@ -343,10 +567,47 @@ class ModelManager:
         logger.info(f"Starting download_all (include_optional={include_optional})")
         logger.info(f"Offline mode: {is_offline_mode()}")
 
-        # Download HuggingFace models
-        for model_id, info in MODELS_INFO.items():
-            if not include_optional and not info["required"]:
-                logger.debug(f"Skipping optional model: {model_id}")
+        selected = {
+            model_id: MODELS_INFO[model_id]
+            for model_id in (MODELS_INFO if include_optional else _REQUIRED_MODEL_IDS)
+        }
+
+        # Fetch HuggingFace repos concurrently. OCR downloads stay serial
+        # because EasyOCR readers share the same detector files.
+        hf_ids = [model_id for model_id in _HF_MODEL_IDS if model_id in selected]
+        hf_futures = {}
+        if hf_ids:
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_DOWNLOAD_WORKERS, len(hf_ids)),
+                thread_name_prefix="hf-download",
+            ) as executor:
+                for model_id in hf_ids:
+                    logger.info(f"Processing model: {selected[model_id]['name']}")
+                    if progress_callback:
+                        progress_callback(f"Checking {selected[model_id]['name']}...")
+                    hf_futures[model_id] = executor.submit(
+                        self.download_model, model_id, progress_callback
+                    )
+
+        # All EasyOCR languages go through one Reader, so the detector and
+        # torch are initialised once rather than per language
+        easyocr_ids = [model_id for model_id in _EASYOCR_MODEL_IDS if model_id in selected]
+        easyocr_languages = list(dict.fromkeys(
+            selected[model_id].get("language", "en") for model_id in easyocr_ids
+        ))
+        easyocr_success = None
+        if easyocr_languages:
+            logger.info(f"Downloading EasyOCR models ({', '.join(easyocr_languages)})...")
+            if progress_callback:
+                progress_callback(f"Downloading EasyOCR models ({', '.join(easyocr_languages)})...")
+            easyocr_success = self.download_easyocr_model(easyocr_languages, progress_callback)
+
+        for model_id, info in selected.items():
+            if model_id in hf_futures:
+                results[model_id] = hf_futures[model_id].result()
+                continue
+            if model_id in easyocr_ids:
+                results[model_id] = easyocr_success
                 continue
 
             logger.info(f"Processing model: {info['name']}")
@@ -358,11 +619,14 @@ class ModelManager:
 
         # Always include OCR models when downloading all
         if include_optional:
-            # Download EasyOCR models
-            logger.info("Downloading EasyOCR models (en, ar)...")
-            if progress_callback:
-                progress_callback("Downloading EasyOCR models (en, ar)...")
-            results["easyocr_all"] = self.download_easyocr_model(["en", "ar"], progress_callback)
+            # Download EasyOCR models, unless the batch above covered them
+            if easyocr_success is not None and {"en", "ar"} <= set(easyocr_languages):
+                results["easyocr_all"] = easyocr_success
+            else:
+                logger.info("Downloading EasyOCR models (en, ar)...")
+                if progress_callback:
+                    progress_callback("Downloading EasyOCR models (en, ar)...")
+                results["easyocr_all"] = self.download_easyocr_model(["en", "ar"], progress_callback)
 
             # Verify RapidOCR
             logger.info("Verifying RapidOCR models...")
@@ -379,33 +643,26 @@ class ModelManager:
 
     def copy_from_cache(self, progress_callback=None) -> dict[str, bool]:
         """Copy models from default cache locations to local models directory."""
-        results = {}
+        # (result key, source, destination, copy function)
+        jobs = []
 
         # Copy HuggingFace models
-        default_hf_cache = Path.home() / ".cache" / "huggingface" / "hub"
+        default_hf_cache = _DEFAULT_HF_CACHE
         if default_hf_cache.exists():
             if progress_callback:
                 progress_callback("Copying HuggingFace models...")
 
             local_hub = self.huggingface_dir / "hub"
-            local_hub.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(local_hub)
 
             for item in default_hf_cache.iterdir():
                 if item.name.startswith("models--"):
                     dest = local_hub / item.name
                     if not dest.exists():
-                        if progress_callback:
-                            progress_callback(f"  Copying {item.name}...")
-                        try:
-                            shutil.copytree(item, dest)
-                            results[item.name] = True
-                        except Exception as e:
-                            if progress_callback:
-                                progress_callback(f"  Failed: {e}")
-                            results[item.name] = False
+                        jobs.append((item.name, item, dest, _copy_tree))
 
         # Copy EasyOCR models
-        default_easyocr = Path.home() / ".EasyOCR" / "model"
+        default_easyocr = _DEFAULT_EASYOCR_DIR
         if default_easyocr.exists():
             if progress_callback:
                 progress_callback("Copying EasyOCR models...")
@@ -413,16 +670,34 @@ class ModelManager:
             for item in default_easyocr.iterdir():
                 dest = self.easyocr_dir / item.name
                 if not dest.exists():
+                    jobs.append((f"easyocr_{item.name}", item, dest, _fast_copy))
+
+        if not jobs:
+            return {}
+
+        # Copies are I/O-bound; several in flight keep the disk queue full.
+        # Progress is reported from this thread only.
+        results = {}
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_COPY_WORKERS, len(jobs)),
+            thread_name_prefix="cache-copy",
+        ) as executor:
+            futures = []
+            for key, src, dest, copy in jobs:
+                if progress_callback:
+                    progress_callback(f"  Copying {src.name}...")
+                futures.append((key, executor.submit(copy, src, dest)))
+
+            for key, future in futures:
+                try:
+                    future.result()
+                    results[key] = True
+                except Exception as e:
                     if progress_callback:
-                        progress_callback(f"  Copying {item.name}...")
-                    try:
-                        shutil.copy2(item, dest)
-                        results[f"easyocr_{item.name}"] = True
-                    except Exception as e:
-                        if progress_callback:
-                            progress_callback(f"  Failed: {e}")
-                        results[f"easyocr_{item.name}"] = False
+                        progress_callback(f"  Failed: {e}")
+                    results[key] = False
 
+        self.invalidate_status_cache()
         return results
 
     def is_offline_mode(self) -> bool:
@@ -434,16 +709,53 @@ class ModelManager:
         return get_offline_status()
 
     def clear_cache(self) -> bool:
-        """Clear the local models directory."""
+        """Clear the local models directory.
+
+        The old tree is renamed aside and deleted on a background thread,
+        so this returns as soon as the fresh, empty directories exist. The
+        thread is not a daemon, so a CLI process still finishes the delete
+        before exiting.
+        """
         try:
             if self.models_dir.exists():
-                shutil.rmtree(self.models_dir)
-                self.models_dir.mkdir(parents=True)
-                self.huggingface_dir.mkdir(parents=True)
-                self.easyocr_dir.mkdir(parents=True)
+                self._ensured_dirs.clear()
+                trash = self.models_dir.with_name(
+                    f"{self.models_dir.name}{_TRASH_SUFFIX}{os.getpid()}-{time.monotonic_ns()}"
+                )
+                try:
+                    self.models_dir.rename(trash)
+                except OSError:
+                    shutil.rmtree(self.models_dir)
+                else:
+                    threading.Thread(
+                        target=_remove_trash,
+                        args=(self.models_dir,),
+                        name="clear-models",
+                    ).start()
+                self._ensure_dir(self.huggingface_dir)
+                self._ensure_dir(self.easyocr_dir)
             return True
         except Exception:
             return False
+        finally:
+            self.invalidate_status_cache()
+
+    def _cached_tree_size(self, root: Path) -> int:
+        """_tree_size(root), reused while root's mtime is unchanged.
+
+        Changes deep inside the tree don't touch root's mtime. Downloads,
+        copies and clears done through this manager invalidate the cache
+        explicitly.
+        """
+        mtime = _mtime_ns(root)
+        if mtime is None:
+            return 0
+        cached = self._disk_usage_cache.get(root)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        size = _tree_size(root)
+        self._disk_usage_cache[root] = (mtime, size)
+        return size
 
     def get_disk_usage(self) -> dict[str, int]:
         """Get disk usage of models directory."""
@@ -453,16 +765,8 @@ class ModelManager:
             "easyocr": 0,
         }
 
-        def get_size(path: Path) -> int:
-            total = 0
-            if path.exists():
-                for item in path.rglob("*"):
-                    if item.is_file():
-                        total += item.stat().st_size
-            return total
-
-        usage["huggingface"] = get_size(self.huggingface_dir)
-        usage["easyocr"] = get_size(self.easyocr_dir)
+        usage["huggingface"] = self._cached_tree_size(self.huggingface_dir)
+        usage["easyocr"] = self._cached_tree_size(self.easyocr_dir)
         usage["total"] = usage["huggingface"] + usage["easyocr"]
 
         return usage
@@ -1,5 +1,6 @@
 """Pydantic models for Docling Playground."""
 
+from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -9,6 +10,7 @@ from .config import (
     OCRLibrary,
     OutputFormat,
     PipelineType,
+    TableMode,
     DEFAULT_OPTIONS,
 )
 
@@ -25,8 +27,6 @@ class ProcessingTiming(BaseModel):
 
     def format_breakdown(self) -> str:
         """Format timing breakdown as a tree string."""
-        lines = [f"Total Time: {self.total_seconds:.2f}s"]
-
         stages = [
             ("Document Loading", self.loading_seconds),
             ("OCR", self.ocr_seconds),
@@ -37,12 +37,15 @@ class ProcessingTiming(BaseModel):
 
         # Filter out None values
         active_stages = [(name, time) for name, time in stages if time is not None]
+        last = len(active_stages) - 1
 
-        for i, (name, time) in enumerate(active_stages):
-            prefix = "└──" if i == len(active_stages) - 1 else "├──"
-            lines.append(f"{prefix} {name}: {time:.2f}s")
-
-        return "\n".join(lines)
+        return "\n".join([
+            f"Total Time: {self.total_seconds:.2f}s",
+            *(
+                f"{'└──' if i == last else '├──'} {name}: {time:.2f}s"
+                for i, (name, time) in enumerate(active_stages)
+            ),
+        ])
 
     def format_badge(self) -> str:
         """Format timing as a badge string."""
@@ -63,13 +66,25 @@ class ProcessingOptions(BaseModel):
 
     # Advanced features
     do_table_structure: bool = Field(default=DEFAULT_OPTIONS["do_table_structure"])
+    table_mode: TableMode = Field(default=DEFAULT_OPTIONS["table_mode"])
     do_code_enrichment: bool = Field(default=DEFAULT_OPTIONS["do_code_enrichment"])
     do_formula_enrichment: bool = Field(default=DEFAULT_OPTIONS["do_formula_enrichment"])
     do_picture_description: bool = Field(default=DEFAULT_OPTIONS["do_picture_description"])
 
     # Output settings
     output_format: OutputFormat = Field(default=DEFAULT_OPTIONS["output_format"])
-    chunk_max_tokens: int = Field(default=DEFAULT_OPTIONS["chunk_max_tokens"])
+    # Chunking works on the document itself, so either export can be skipped
+    include_markdown: bool = Field(default=DEFAULT_OPTIONS["include_markdown"])
+    include_json: bool = Field(default=DEFAULT_OPTIONS["include_json"])
+    # Same range as the UI slider
+    chunk_max_tokens: int = Field(default=DEFAULT_OPTIONS["chunk_max_tokens"], ge=64, le=2048)
+    # Write markdown/JSON to files and return their paths instead (library
+    # use only; the API rejects it). The caller owns and must delete the
+    # files, e.g. with ProcessingResult.remove_output_files().
+    lazy_outputs: bool = Field(default=DEFAULT_OPTIONS["lazy_outputs"])
+
+    # Performance
+    num_threads: int | None = Field(default=DEFAULT_OPTIONS["num_threads"], ge=1)
 
 
 class ChunkInfo(BaseModel):
@@ -79,7 +94,7 @@ class ChunkInfo(BaseModel):
     text: str = Field(description="Full chunk text")
     preview: str = Field(description="Truncated preview of chunk text")
     page_num: int | None = Field(default=None, description="Page number if available")
-    token_count: int = Field(description="Approximate token count")
+    token_count: int = Field(description="Token count from the chunker tokenizer")
 
 
 class ProcessingStats(BaseModel):
@@ -103,6 +118,8 @@ class ProcessingResult(BaseModel):
     # Document output
     markdown: str = Field(default="", description="Markdown representation")
     json_data: dict[str, Any] = Field(default_factory=dict, description="Full DoclingDocument as dict")
+    markdown_path: str | None = Field(default=None, description="Markdown file path when outputs are lazy")
+    json_path: str | None = Field(default=None, description="JSON file path when outputs are lazy")
 
     # Chunks
     chunks: list[ChunkInfo] = Field(default_factory=list, description="Document chunks")
@@ -123,6 +140,14 @@ class ProcessingResult(BaseModel):
             return self.timing.format_breakdown()
         return "No timing information available"
 
+    def remove_output_files(self) -> None:
+        """Delete the files written for lazy outputs, if any."""
+        for path in (self.markdown_path, self.json_path):
+            if path:
+                Path(path).unlink(missing_ok=True)
+        self.markdown_path = None
+        self.json_path = None
+
 
 class ModelStatus(BaseModel):
     """Status of a downloadable model."""
@@ -1,11 +1,30 @@
 """Core document processing logic using Docling."""
 
+import asyncio
+import hashlib
+import ipaddress
 import logging
+import mimetypes
+import os
+import socket
+import ssl
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from http.client import HTTPConnection, HTTPSConnection
+from io import BytesIO
+from operator import attrgetter
 from pathlib import Path
-from typing import BinaryIO
+from typing import TYPE_CHECKING, BinaryIO, ClassVar, Iterable, Iterator
+from urllib.parse import unquote, urljoin, urlparse
 
-from docling.datamodel.base_models import InputFormat
+import orjson
+
+from docling.datamodel.base_models import ConversionStatus, DocumentStream, InputFormat
 from docling.datamodel.pipeline_options import (
     AcceleratorDevice,
     AcceleratorOptions,
@@ -15,10 +34,11 @@ from docling.datamodel.pipeline_options import (
     TableFormerMode,
     TableStructureOptions,
 )
-from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
 
-from .config import Accelerator, OCRLibrary, PipelineType, enable_offline_mode, is_offline_mode, EASYOCR_MODELS_DIR
+if TYPE_CHECKING:
+    from docling.document_converter import DocumentConverter
+
+from .config import MAX_UPLOAD_BYTES, SUPPORTED_FILE_EXTENSION_SET, Accelerator, OCRLibrary, PipelineType, TableMode, enable_offline_mode, is_offline_mode, EASYOCR_MODELS_DIR
 
 logger = logging.getLogger("docling-playground.processor")
 from .models import (
@@ -28,26 +48,430 @@ from .models import (
     ProcessingStats,
     ProcessingTiming,
 )
-from .chunker import DocumentChunker
+from .chunker import DEFAULT_TOKENIZER, DocumentChunker
+
+# Each converter holds its own layout/table/OCR models, so keep only a few
+MAX_CACHED_CONVERTERS = int(os.getenv("MAX_CACHED_CONVERTERS", "4"))
+
+_ACCEL_MAP = {
+    Accelerator.AUTO: AcceleratorDevice.AUTO,
+    Accelerator.CPU: AcceleratorDevice.CPU,
+    Accelerator.CUDA: AcceleratorDevice.CUDA,
+    Accelerator.MPS: AcceleratorDevice.MPS,
+}
+
+_TABLE_MODE_MAP = {
+    TableMode.FAST: TableFormerMode.FAST,
+    TableMode.ACCURATE: TableFormerMode.ACCURATE,
+}
+
+URL_FETCH_TIMEOUT_SECONDS = 60
+URL_FETCH_CHUNK_SIZE = 1024 * 1024
+URL_FETCH_MAX_REDIRECTS = 5
+
+# process_files shares one long-lived pool so each worker thread keeps its
+# chunker (and loaded tokenizer) between calls
+PROCESS_FILES_WORKERS = int(os.getenv("PROCESS_FILES_WORKERS", str(min(8, os.cpu_count() or 1))))
+_file_executor = ThreadPoolExecutor(
+    max_workers=PROCESS_FILES_WORKERS,
+    thread_name_prefix="docling-file",
+)
+
+# One-page PDF run through each new GPU converter so CUDA context setup,
+# kernel autotuning and ONNX provider loading happen at build time, not on
+# the first real document. Converters that end up on CPU skip it.
+_WARMUP_PDF = (
+    b"%PDF-1.4\n"
+    b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n"
+    b"2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n"
+    b"3 0 obj\n<< /Type /Page /Parent 2 0 R /MediaBox [0 0 200 100] /Contents 4 0 R"
+    b" /Resources << /Font << /F1 5 0 R >> >> >>\nendobj\n"
+    b"4 0 obj\n<< /Length 37 >>\nstream\nBT /F1 12 Tf 20 50 Td (Warm up) Tj ET\nendstream\nendobj\n"
+    b"5 0 obj\n<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>\nendobj\n"
+    b"xref\n0 6\n"
+    b"0000000000 65535 f \n"
+    b"0000000009 00000 n \n"
+    b"0000000058 00000 n \n"
+    b"0000000115 00000 n \n"
+    b"0000000241 00000 n \n"
+    b"0000000328 00000 n \n"
+    b"trailer\n<< /Size 6 /Root 1 0 R >>\nstartxref\n398\n%%EOF\n"
+)
+
+# Share of conversion time attributed to (OCR, layout, table) stages, keyed by
+# (ocr_enabled, do_table_structure). None leaves a stage that did not run unset.
+_STAGE_RATIOS = {
+    (True, True): (0.4, 0.35, 0.15),
+    (True, False): (0.4, 0.35, None),
+    (False, True): (None, 0.6, 0.15),
+    (False, False): (None, 0.6, None),
+}
+
+# Finished results keyed by document content and options. Off unless a
+# directory is given, since entries hold the full text of every document.
+RESULT_CACHE_DIR = os.getenv("RESULT_CACHE_DIR", "")
+# Least recently used entries are pruned once the cache grows past this
+RESULT_CACHE_MAX_BYTES = int(os.getenv("RESULT_CACHE_MAX_BYTES", str(1024 * 1024 * 1024)))
+# Options that do not change the result
+_RESULT_KEY_EXCLUDE = {"output_format", "num_threads"}
+
+
+@lru_cache(maxsize=None)
+def _standard_pipeline():
+    """Import the standard PDF pipeline, which pulls in the layout/table models."""
+    from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+
+    return StandardPdfPipeline
+
+
+@lru_cache(maxsize=None)
+def _vlm_pipeline():
+    """Import the VLM pipeline and its options, or None if it is not installed."""
+    try:
+        from docling.pipeline.vlm_pipeline import VlmPipeline
+        from docling.datamodel.pipeline_options import VlmPipelineOptions
+    except ImportError:
+        return None
+    return VlmPipeline, VlmPipelineOptions
+
+
+_prune_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _result_cache_version() -> bytes:
+    """Versions that can change a result, so upgrades invalidate old entries."""
+    parts = []
+    for package in ("docling", "docling-core", "docling-playground"):
+        try:
+            parts.append(f"{package}={version(package)}")
+        except PackageNotFoundError:
+            parts.append(f"{package}=unknown")
+    parts.append(f"tokenizer={DEFAULT_TOKENIZER}")
+    return ";".join(parts).encode()
+
+
+def _result_cache_key(source, options: ProcessingOptions) -> str | None:
+    """Hash a document's content with the options, or None for URLs."""
+    if isinstance(source, DocumentStream):
+        with source.stream.getbuffer() as view:
+            digest = hashlib.sha256(view)
+    elif isinstance(source, str) and source.startswith(("http://", "https://")):
+        return None
+    else:
+        with open(source, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256")
+
+    digest.update(options.model_dump_json(exclude=_RESULT_KEY_EXCLUDE).encode())
+    digest.update(_result_cache_version())
+    return digest.hexdigest()
+
+
+def _result_cache_path(key: str) -> Path:
+    """Cache file for a key, sharded by its first two hex digits."""
+    return Path(RESULT_CACHE_DIR) / key[:2] / f"{key}.json"
+
+
+def _load_cached_result(key: str) -> ProcessingResult | None:
+    """Read a cached result, treating unreadable entries as misses."""
+    path = _result_cache_path(key)
+    try:
+        result = ProcessingResult.model_validate_json(path.read_bytes())
+        # mtime doubles as last-use time for pruning
+        os.utime(path)
+        return result
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cached result {key}: {e}")
+        return None
+
+
+def _rename_cached_result(result: ProcessingResult, source) -> None:
+    """Point a cached result's document name at this source.
+
+    The key covers content, not the filename, so the same bytes uploaded
+    under another name hit the entry; Docling names the document after
+    the file, so rewrite those fields to match.
+    """
+    if not result.json_data:
+        return
+    filename = source.name if isinstance(source, DocumentStream) else Path(source).name
+    result.json_data["name"] = Path(filename).stem or "file"
+    if isinstance(result.json_data.get("origin"), dict):
+        result.json_data["origin"]["filename"] = filename
+
+
+def _store_result(key: str, result: ProcessingResult) -> None:
+    """Write a result to the cache atomically; failures only log."""
+    path = _result_cache_path(key)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(result.model_dump_json(), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not cache result {key}: {e}")
+        tmp_path.unlink(missing_ok=True)
+        return
+    _prune_result_cache()
+
+
+def _prune_result_cache() -> None:
+    """Delete least recently used entries until the cache fits RESULT_CACHE_MAX_BYTES."""
+    # One pruner at a time; a concurrent store can skip it
+    if not _prune_lock.acquire(blocking=False):
+        return
+    try:
+        entries = []
+        total = 0
+        for shard in os.scandir(RESULT_CACHE_DIR):
+            if not shard.is_dir(follow_symlinks=False):
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".json"):
+                    stat = entry.stat(follow_symlinks=False)
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+
+        if total <= RESULT_CACHE_MAX_BYTES:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            Path(path).unlink(missing_ok=True)
+            total -= size
+            if total <= RESULT_CACHE_MAX_BYTES:
+                break
+    except OSError as e:
+        logger.warning(f"Could not prune result cache: {e}")
+    finally:
+        _prune_lock.release()
+
+
+def _estimate_stage_times(timing: ProcessingTiming, convert_time: float, options: ProcessingOptions) -> None:
+    """Split conversion time into stages (Docling doesn't expose individual stage timing)."""
+    ocr_ratio, layout_ratio, table_ratio = _STAGE_RATIOS[(options.ocr_enabled, options.do_table_structure)]
+    timing.ocr_seconds = None if ocr_ratio is None else convert_time * ocr_ratio
+    timing.layout_seconds = convert_time * layout_ratio
+    timing.table_seconds = None if table_ratio is None else convert_time * table_ratio
+
+
+def _connect_public(host: str, port: int, timeout: float) -> socket.socket:
+    """Open a TCP connection to ``host`` after checking every address it resolves to.
+
+    The socket goes to an address that was checked, so a DNS answer that
+    changes between the check and the connect cannot reach a private host.
+    """
+    addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    for *_, sockaddr in addresses:
+        if not ipaddress.ip_address(sockaddr[0]).is_global:
+            raise ValueError(f"URL host is not a public address: {host}")
+
+    error: OSError | None = None
+    for family, socktype, proto, _, sockaddr in addresses:
+        sock = socket.socket(family, socktype, proto)
+        try:
+            sock.settimeout(timeout)
+            sock.connect(sockaddr)
+            return sock
+        except OSError as e:
+            sock.close()
+            error = e
+    raise error or OSError(f"Could not connect to {host}")
+
+
+def _remaining(deadline: float) -> float:
+    """Seconds left before ``deadline``, raising TimeoutError once it has passed."""
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError(f"Download took longer than {URL_FETCH_TIMEOUT_SECONDS}s")
+    return remaining
+
+
+def _document_name(url: str, content_type: str) -> str:
+    """Name a fetched document so Docling can detect its format.
+
+    Uses the last URL path segment, adding an extension from the
+    Content-Type when the segment's own suffix is not a supported one
+    (e.g. ``/pdf/2408.09869`` served as application/pdf).
+    """
+    name = unquote(Path(urlparse(url).path).name) or "document"
+    if Path(name).suffix.lower() not in SUPPORTED_FILE_EXTENSION_SET:
+        name += mimetypes.guess_extension(content_type) or ""
+    return name
+
+
+def fetch_url(url: str, max_bytes: int = MAX_UPLOAD_BYTES) -> tuple[str, bytes]:
+    """Download a document from a public http(s) URL.
+
+    Only hosts (including redirect targets) that resolve to public
+    addresses are contacted. The body is capped at ``max_bytes`` and the
+    whole download, however slowly the server sends, at
+    URL_FETCH_TIMEOUT_SECONDS. Returns a filename for format detection
+    and the body. Raises ValueError for rejected URLs or oversized bodies
+    and OSError (including TimeoutError) for network failures.
+    """
+    deadline = time.monotonic() + URL_FETCH_TIMEOUT_SECONDS
+
+    for _ in range(URL_FETCH_MAX_REDIRECTS + 1):
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise ValueError(f"Only http(s) URLs are supported: {url}")
+
+        https = parsed.scheme == "https"
+        port = parsed.port or (443 if https else 80)
+        sock = _connect_public(parsed.hostname, port, _remaining(deadline))
+        if https:
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=parsed.hostname)
+
+        # The connection is already open, so http.client never resolves the host itself
+        connection = (HTTPSConnection if https else HTTPConnection)(parsed.hostname, port)
+        connection.sock = sock
+        try:
+            path = parsed.path or "/"
+            if parsed.query:
+                path += f"?{parsed.query}"
+            connection.request("GET", path, headers={"User-Agent": "docling-playground"})
+            response = connection.getresponse()
+
+            if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+                url = urljoin(url, response.getheader("Location"))
+                continue
+            if response.status != 200:
+                raise OSError(f"HTTP {response.status} {response.reason}")
+
+            content_length = response.getheader("Content-Length", "")
+            if content_length.isdigit() and int(content_length) > max_bytes:
+                raise ValueError(f"Document exceeds {max_bytes} bytes")
+
+            parts = []
+            received = 0
+            while True:
+                # Each read returns as soon as any data arrives, so a server
+                # dripping bytes still hits the overall deadline
+                sock.settimeout(_remaining(deadline))
+                chunk = response.read1(URL_FETCH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                received += len(chunk)
+                if received > max_bytes:
+                    raise ValueError(f"Document exceeds {max_bytes} bytes")
+                parts.append(chunk)
+
+            return _document_name(url, response.msg.get_content_type()), b"".join(parts)
+        finally:
+            connection.close()
+            sock.close()
+
+    raise OSError(f"Too many redirects fetching {url}")
+
+
+def _write_output(data: bytes, suffix: str, directory: Path | None) -> str:
+    """Write a lazy output to a new file the caller owns and return its path."""
+    with tempfile.NamedTemporaryFile(suffix=suffix, prefix="docling-", dir=directory, delete=False) as tmp:
+        tmp.write(data)
+    return tmp.name
+
+
+@lru_cache(maxsize=None)
+def _check_rapidocr_cuda(accelerator: Accelerator) -> None:
+    """Warn once if RapidOCR would silently run on CPU despite a GPU being requested.
+
+    RapidOCR only uses the GPU through onnxruntime's CUDAExecutionProvider,
+    which the plain ``onnxruntime`` wheel does not ship.
+    """
+    if accelerator == Accelerator.AUTO:
+        try:
+            import torch
+        except ImportError:
+            return
+        if not torch.cuda.is_available():
+            return
+    elif accelerator != Accelerator.CUDA:
+        return
+
+    try:
+        import onnxruntime
+    except ImportError:
+        return
+    if "CUDAExecutionProvider" not in onnxruntime.get_available_providers():
+        logger.warning(
+            "CUDA requested but onnxruntime has no CUDAExecutionProvider - "
+            "RapidOCR will run on CPU. Install onnxruntime-gpu to use the GPU."
+        )
+
+
+@lru_cache(maxsize=None)
+def _uses_gpu(accelerator: Accelerator) -> bool:
+    """Whether an accelerator setting resolves to a GPU on this machine."""
+    if accelerator == Accelerator.CPU:
+        return False
+    try:
+        import torch
+    except ImportError:
+        return False
+
+    cuda = torch.cuda.is_available()
+    mps = torch.backends.mps.is_available()
+    if accelerator == Accelerator.CUDA:
+        return cuda
+    if accelerator == Accelerator.MPS:
+        return mps
+    return cuda or mps
+
+
+def _converter_key(options: ProcessingOptions) -> tuple:
+    """Options that require a different converter when they change."""
+    return (
+        options.pipeline,
+        options.accelerator,
+        options.ocr_enabled,
+        options.ocr_library,
+        tuple(options.ocr_languages),
+        options.force_full_page_ocr,
+        options.do_table_structure,
+        options.table_mode,
+        options.do_code_enrichment,
+        options.do_formula_enrichment,
+        options.do_picture_description,
+        options.num_threads,
+    )
 
 
 class DocumentProcessor:
     """Handles document processing with configurable options."""
 
-    def __init__(self):
-        self._converter: DocumentConverter | None = None
-        self._current_options: ProcessingOptions | None = None
-        self._chunker = DocumentChunker()
-
-    def _get_accelerator_device(self, accelerator: Accelerator) -> AcceleratorDevice:
-        """Map accelerator option to AcceleratorDevice."""
-        mapping = {
-            Accelerator.AUTO: AcceleratorDevice.AUTO,
-            Accelerator.CPU: AcceleratorDevice.CPU,
-            Accelerator.CUDA: AcceleratorDevice.CUDA,
-            Accelerator.MPS: AcceleratorDevice.MPS,
-        }
-        return mapping.get(accelerator, AcceleratorDevice.AUTO)
+    # Shared by all instances so switching options back and forth does not
+    # reload models; least recently used converters are evicted first.
+    # Entries are futures so a build in progress can be waited on without
+    # holding the lock, which only guards the dict itself.
+    _converter_cache: ClassVar[OrderedDict[tuple, "Future[DocumentConverter]"]] = OrderedDict()
+    _converter_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, num_threads: int | None = None, output_dir: str | Path | None = None):
+        """Create a processor.
+
+        Args:
+            num_threads: Threads per conversion when the options do not set
+                ``num_threads``. Defaults to every core, which suits one
+                conversion at a time; callers running several at once should
+                divide the cores between them.
+            output_dir: Where ``lazy_outputs`` files are written; defaults to
+                the system temp directory. Either way the caller owns the
+                files and must delete them (ProcessingResult.remove_output_files).
+        """
+        self._num_threads = num_threads or os.cpu_count() or 4
+        self._output_dir = Path(output_dir) if output_dir is not None else None
+        # HF tokenizers are not safe to share across threads, so each
+        # processing thread gets its own chunker (and tokenizer)
+        self._chunker_local = threading.local()
+
+    def _get_chunker(self) -> DocumentChunker:
+        """Return this thread's chunker, creating it on first use."""
+        chunker = getattr(self._chunker_local, "chunker", None)
+        if chunker is None:
+            chunker = self._chunker_local.chunker = DocumentChunker()
+        return chunker
 
     def _get_ocr_options(self, options: ProcessingOptions):
         """Get OCR options based on selected library."""
@@ -62,45 +486,46 @@ class DocumentProcessor:
                 download_enabled=False,  # Disable downloads - use local models only
             )
         elif options.ocr_library == OCRLibrary.RAPIDOCR:
+            _check_rapidocr_cuda(options.accelerator)
             return RapidOcrOptions(
                 force_full_page_ocr=options.force_full_page_ocr,
             )
 
         return None
 
-    def _build_converter(self, options: ProcessingOptions) -> DocumentConverter:
+    def _build_converter(self, options: ProcessingOptions) -> "DocumentConverter":
         """Build a DocumentConverter with the given options."""
+        from docling.document_converter import DocumentConverter, PdfFormatOption
+
         # Accelerator options
         accelerator_options = AcceleratorOptions(
-            device=self._get_accelerator_device(options.accelerator),
-            num_threads=4,
+            device=_ACCEL_MAP.get(options.accelerator, AcceleratorDevice.AUTO),
+            num_threads=options.num_threads,
         )
 
         # Handle VLM pipeline - needs different pipeline options
         if options.pipeline == PipelineType.VLM:
-            try:
-                from docling.pipeline.vlm_pipeline import VlmPipeline
-                from docling.datamodel.pipeline_options import VlmPipelineOptions
-
-                pipeline_cls = VlmPipeline
-                pipeline_options = VlmPipelineOptions(
+            vlm = _vlm_pipeline()
+            if vlm is not None:
+                pipeline_cls, vlm_options_cls = vlm
+                pipeline_options = vlm_options_cls(
                     accelerator_options=accelerator_options,
                 )
                 logger.info("Using VLM pipeline with VlmPipelineOptions")
-            except ImportError:
+            else:
                 # Fall back to standard if VLM not available
                 logger.warning("VLM pipeline not available, falling back to standard")
-                pipeline_cls = StandardPdfPipeline
+                pipeline_cls = _standard_pipeline()
                 pipeline_options = PdfPipelineOptions(
                     accelerator_options=accelerator_options,
                     do_ocr=options.ocr_enabled,
                     do_table_structure=options.do_table_structure,
                     table_structure_options=TableStructureOptions(
-                        mode=TableFormerMode.ACCURATE,
+                        mode=_TABLE_MODE_MAP[options.table_mode],
                     ),
                 )
         else:
-            pipeline_cls = StandardPdfPipeline
+            pipeline_cls = _standard_pipeline()
             # Pipeline options for standard pipeline
             pipeline_options = PdfPipelineOptions(
                 accelerator_options=accelerator_options,
@@ -110,7 +535,7 @@ class DocumentProcessor:
                 do_formula_enrichment=options.do_formula_enrichment,
                 do_picture_description=options.do_picture_description,
                 table_structure_options=TableStructureOptions(
-                    mode=TableFormerMode.ACCURATE,
+                    mode=_TABLE_MODE_MAP[options.table_mode],
                 ),
             )
 
@@ -130,35 +555,135 @@ class DocumentProcessor:
 
         return DocumentConverter(format_options=format_options)
 
-    def _needs_rebuild(self, options: ProcessingOptions) -> bool:
-        """Check if converter needs to be rebuilt for new options."""
-        if self._converter is None or self._current_options is None:
-            return True
-
-        # Check if key options changed
-        return (
-            self._current_options.pipeline != options.pipeline
-            or self._current_options.accelerator != options.accelerator
-            or self._current_options.ocr_enabled != options.ocr_enabled
-            or self._current_options.ocr_library != options.ocr_library
-            or self._current_options.ocr_languages != options.ocr_languages
-            or self._current_options.force_full_page_ocr != options.force_full_page_ocr
-            or self._current_options.do_table_structure != options.do_table_structure
-            or self._current_options.do_code_enrichment != options.do_code_enrichment
-            or self._current_options.do_formula_enrichment != options.do_formula_enrichment
-            or self._current_options.do_picture_description != options.do_picture_description
+    def _get_converter(self, options: ProcessingOptions) -> "DocumentConverter":
+        """Return a cached converter for these options, building one on a miss."""
+        if options.num_threads is None:
+            options = options.model_copy(update={"num_threads": self._num_threads})
+
+        key = _converter_key(options)
+        with self._converter_lock:
+            future = self._converter_cache.get(key)
+            building = future is None
+            if building:
+                # This thread builds; concurrent misses on the key wait on it
+                future = Future()
+                self._converter_cache[key] = future
+                while len(self._converter_cache) > MAX_CACHED_CONVERTERS:
+                    self._converter_cache.popitem(last=False)
+            else:
+                self._converter_cache.move_to_end(key)
+
+        if not building:
+            logger.debug("Reusing existing converter")
+            return future.result()
+
+        try:
+            logger.info("Building document converter...")
+            converter = self._build_converter(options)
+            if _uses_gpu(options.accelerator):
+                self._run_warmup_page(converter)
+        except BaseException as e:
+            # Drop the failed entry so the next request retries the build
+            with self._converter_lock:
+                if self._converter_cache.get(key) is future:
+                    del self._converter_cache[key]
+            future.set_exception(e)
+            raise
+
+        future.set_result(converter)
+        logger.info("Converter built successfully")
+        return converter
+
+    def _run_warmup_page(self, converter: "DocumentConverter") -> None:
+        """Convert the embedded one-page PDF to initialize the models on the device."""
+        warmup_start = time.perf_counter()
+        try:
+            converter.convert(
+                DocumentStream(name="warmup.pdf", stream=BytesIO(_WARMUP_PDF)),
+                raises_on_error=False,
+            )
+        except Exception as e:
+            logger.warning(f"Converter warm-up page failed: {e}")
+            return
+        logger.info(f"Converter warm-up page done in {time.perf_counter() - warmup_start:.2f}s")
+
+    def _build_result(
+        self,
+        doc,
+        options: ProcessingOptions,
+        timing: ProcessingTiming,
+        start_time: float,
+        convert_time: float,
+    ) -> ProcessingResult:
+        """Export, chunk and summarize a converted document."""
+        _estimate_stage_times(timing, convert_time, options)
+
+        # Generate outputs (chunking below works on doc, not on these)
+        markdown = doc.export_to_markdown() if options.include_markdown else ""
+        json_data = doc.export_to_dict() if options.include_json else {}
+
+        # Chunk document
+        chunk_start = time.perf_counter()
+        chunks = self._get_chunker().chunk_document(doc, options.chunk_max_tokens)
+        timing.chunking_seconds = time.perf_counter() - chunk_start
+
+        # Gather statistics
+        stats = ProcessingStats(
+            num_pages=len(getattr(doc, "pages", ())),
+            num_tables=len(getattr(doc, "tables", ())),
+            num_figures=len(getattr(doc, "pictures", ())),
+            num_chunks=len(chunks),
+            total_tokens=sum(map(attrgetter("token_count"), chunks)),
+            ocr_library_used=options.ocr_library.value if options.ocr_enabled else None,
+            pipeline_used=options.pipeline.value,
         )
 
-    def process_file(
+        if options.lazy_outputs:
+            markdown_path = json_path = None
+            if options.include_markdown:
+                markdown_path = _write_output(markdown.encode("utf-8"), ".md", self._output_dir)
+            if options.include_json:
+                json_path = _write_output(orjson.dumps(json_data), ".json", self._output_dir)
+            timing.total_seconds = time.perf_counter() - start_time
+            return ProcessingResult(
+                success=True,
+                markdown_path=markdown_path,
+                json_path=json_path,
+                chunks=chunks,
+                stats=stats,
+                timing=timing,
+            )
+
+        timing.total_seconds = time.perf_counter() - start_time
+
+        return ProcessingResult(
+            success=True,
+            markdown=markdown,
+            json_data=json_data,
+            chunks=chunks,
+            stats=stats,
+            timing=timing,
+        )
+
+    def warm_up(self, options: ProcessingOptions | None = None) -> None:
+        """Build the converter and load its PDF pipeline ahead of the first request."""
+        options = options or ProcessingOptions()
+        enable_offline_mode()
+
+        logger.info("Warming up document converter...")
+        self._get_converter(options).initialize_pipeline(InputFormat.PDF)
+        logger.info("Document converter ready")
+
+    def _process_source(
         self,
-        file_path: str | Path,
+        source: str | Path | DocumentStream,
         options: ProcessingOptions,
     ) -> ProcessingResult:
-        """Process a document file."""
+        """Convert a path, URL or in-memory stream and build its result."""
         # Ensure offline mode is enabled during processing
         enable_offline_mode()
 
-        logger.info(f"Processing file: {file_path}")
+        logger.info(f"Processing: {source.name if isinstance(source, DocumentStream) else source}")
         logger.info(f"Offline mode: {is_offline_mode()}")
         logger.info(f"Pipeline: {options.pipeline.value}, Accelerator: {options.accelerator.value}")
         if options.ocr_enabled:
@@ -174,65 +699,36 @@ class DocumentProcessor:
         start_time = time.perf_counter()
 
         try:
+            # Identical content with identical options gives an identical result
+            # (lazy results point at temp files the caller may delete, so skip them)
+            cache_key = None
+            if RESULT_CACHE_DIR and not options.lazy_outputs:
+                cache_key = _result_cache_key(source, options)
+            if cache_key is not None:
+                cached = _load_cached_result(cache_key)
+                if cached is not None:
+                    logger.info(f"Returning cached result {cache_key[:12]}")
+                    _rename_cached_result(cached, source)
+                    cached.timing = ProcessingTiming(total_seconds=time.perf_counter() - start_time)
+                    return cached
+
             # Build converter if needed
             load_start = time.perf_counter()
-            if self._needs_rebuild(options):
-                logger.info("Building document converter...")
-                self._converter = self._build_converter(options)
-                self._current_options = options
-                logger.info("Converter built successfully")
-            else:
-                logger.debug("Reusing existing converter")
+            converter = self._get_converter(options)
             timing.loading_seconds = time.perf_counter() - load_start
 
             # Convert document
             logger.info("Starting document conversion...")
             convert_start = time.perf_counter()
-            result = self._converter.convert(file_path)
+            result = converter.convert(source)
             doc = result.document
             convert_time = time.perf_counter() - convert_start
             logger.info(f"Conversion completed in {convert_time:.2f}s")
 
-            # Estimate stage times (Docling doesn't expose individual stage timing)
-            if options.ocr_enabled:
-                timing.ocr_seconds = convert_time * 0.4
-                timing.layout_seconds = convert_time * 0.35
-            else:
-                timing.layout_seconds = convert_time * 0.6
-
-            if options.do_table_structure:
-                timing.table_seconds = convert_time * 0.15
-
-            # Generate outputs
-            markdown = doc.export_to_markdown()
-            json_data = doc.export_to_dict()
-
-            # Chunk document
-            chunk_start = time.perf_counter()
-            chunks = self._chunker.chunk_document(doc, options.chunk_max_tokens)
-            timing.chunking_seconds = time.perf_counter() - chunk_start
-
-            # Gather statistics
-            stats = ProcessingStats(
-                num_pages=len(doc.pages) if hasattr(doc, "pages") else 0,
-                num_tables=len([item for item in doc.tables]) if hasattr(doc, "tables") else 0,
-                num_figures=len([item for item in doc.pictures]) if hasattr(doc, "pictures") else 0,
-                num_chunks=len(chunks),
-                total_tokens=sum(c.token_count for c in chunks),
-                ocr_library_used=options.ocr_library.value if options.ocr_enabled else None,
-                pipeline_used=options.pipeline.value,
-            )
-
-            timing.total_seconds = time.perf_counter() - start_time
-
-            return ProcessingResult(
-                success=True,
-                markdown=markdown,
-                json_data=json_data,
-                chunks=chunks,
-                stats=stats,
-                timing=timing,
-            )
+            processing_result = self._build_result(doc, options, timing, start_time, convert_time)
+            if cache_key is not None:
+                _store_result(cache_key, processing_result)
+            return processing_result
 
         except Exception as e:
             timing.total_seconds = time.perf_counter() - start_time
@@ -242,95 +738,142 @@ class DocumentProcessor:
                 timing=timing,
             )
 
-    def process_url(self, url: str, options: ProcessingOptions) -> ProcessingResult:
-        """Process a document from URL."""
-        timing = ProcessingTiming(total_seconds=0)
-        start_time = time.perf_counter()
+    def process_file(
+        self,
+        file_path: str | Path,
+        options: ProcessingOptions,
+    ) -> ProcessingResult:
+        """Process a document file."""
+        return self._process_source(file_path, options)
+
+    def process_files(
+        self,
+        file_paths: Iterable[str | Path],
+        options: ProcessingOptions,
+    ) -> list[ProcessingResult]:
+        """Process several document files concurrently with one shared converter.
+
+        Conversion runs mostly in native code that releases the GIL, so
+        threads overlap well. Results are returned in input order, and
+        failures are reported as failed results like ``process_file`` does.
+        """
+        file_paths = list(file_paths)
+        # Split the cores between the concurrent conversions
+        if options.num_threads is None:
+            options = options.model_copy(
+                update={"num_threads": max(1, (os.cpu_count() or 1) // PROCESS_FILES_WORKERS)}
+            )
 
+        # Build the converter once up front rather than racing for it
+        start_time = time.perf_counter()
         try:
-            # Build converter if needed
-            load_start = time.perf_counter()
-            if self._needs_rebuild(options):
-                self._converter = self._build_converter(options)
-                self._current_options = options
-            timing.loading_seconds = time.perf_counter() - load_start
+            self._get_converter(options)
+        except Exception as e:
+            timing = ProcessingTiming(total_seconds=time.perf_counter() - start_time)
+            return [
+                ProcessingResult(success=False, error=str(e), timing=timing.model_copy())
+                for _ in file_paths
+            ]
 
-            # Convert document from URL
-            convert_start = time.perf_counter()
-            result = self._converter.convert(url)
-            doc = result.document
-            convert_time = time.perf_counter() - convert_start
+        return list(_file_executor.map(lambda path: self.process_file(path, options), file_paths))
 
-            # Estimate stage times
-            if options.ocr_enabled:
-                timing.ocr_seconds = convert_time * 0.4
-                timing.layout_seconds = convert_time * 0.35
-            else:
-                timing.layout_seconds = convert_time * 0.6
-
-            if options.do_table_structure:
-                timing.table_seconds = convert_time * 0.15
-
-            # Generate outputs
-            markdown = doc.export_to_markdown()
-            json_data = doc.export_to_dict()
-
-            # Chunk document
-            chunk_start = time.perf_counter()
-            chunks = self._chunker.chunk_document(doc, options.chunk_max_tokens)
-            timing.chunking_seconds = time.perf_counter() - chunk_start
-
-            # Gather statistics
-            stats = ProcessingStats(
-                num_pages=len(doc.pages) if hasattr(doc, "pages") else 0,
-                num_tables=len([item for item in doc.tables]) if hasattr(doc, "tables") else 0,
-                num_figures=len([item for item in doc.pictures]) if hasattr(doc, "pictures") else 0,
-                num_chunks=len(chunks),
-                total_tokens=sum(c.token_count for c in chunks),
-                ocr_library_used=options.ocr_library.value if options.ocr_enabled else None,
-                pipeline_used=options.pipeline.value,
-            )
+    def process_batch(
+        self,
+        file_paths: Iterable[str | Path],
+        options: ProcessingOptions,
+    ) -> Iterator[ProcessingResult]:
+        """Convert several documents in one ``convert_all`` call.
 
-            timing.total_seconds = time.perf_counter() - start_time
+        Docling batches pages across documents this way, which keeps GPU
+        OCR/layout models busier than one document at a time. Yields one
+        result per input, in order, as each finishes.
+        """
+        enable_offline_mode()
+        start_time = time.perf_counter()
+        loading_seconds = None
 
-            return ProcessingResult(
-                success=True,
-                markdown=markdown,
-                json_data=json_data,
-                chunks=chunks,
-                stats=stats,
-                timing=timing,
+        try:
+            converter = self._get_converter(options)
+            loading_seconds = time.perf_counter() - start_time
+            results = converter.convert_all(file_paths, raises_on_error=False)
+
+            doc_start = time.perf_counter()
+            for result in results:
+                timing = ProcessingTiming(total_seconds=0, loading_seconds=loading_seconds)
+                convert_time = time.perf_counter() - doc_start
+
+                if result.status not in (ConversionStatus.SUCCESS, ConversionStatus.PARTIAL_SUCCESS):
+                    timing.total_seconds = time.perf_counter() - doc_start
+                    errors = "; ".join(error.error_message for error in result.errors)
+                    yield ProcessingResult(
+                        success=False,
+                        error=errors or f"Conversion failed: {result.status.value}",
+                        timing=timing,
+                    )
+                else:
+                    try:
+                        yield self._build_result(result.document, options, timing, doc_start, convert_time)
+                    except Exception as e:
+                        timing.total_seconds = time.perf_counter() - doc_start
+                        yield ProcessingResult(success=False, error=str(e), timing=timing)
+
+                doc_start = time.perf_counter()
+
+        except Exception as e:
+            yield ProcessingResult(
+                success=False,
+                error=str(e),
+                timing=ProcessingTiming(
+                    total_seconds=time.perf_counter() - start_time,
+                    loading_seconds=loading_seconds,
+                ),
             )
 
+    def process_url(self, url: str, options: ProcessingOptions) -> ProcessingResult:
+        """Process a document from URL."""
+        return self._process_source(url, options)
+
+    async def aprocess_url(self, url: str, options: ProcessingOptions) -> ProcessingResult:
+        """Process a document from a public URL, downloading it while the converter builds.
+
+        On a cold converter the fetch and the model load overlap instead of
+        running back to back. The download goes through ``fetch_url``, so
+        its size, time and public-host limits apply.
+        """
+        start_time = time.perf_counter()
+        try:
+            _, (name, data) = await asyncio.gather(
+                asyncio.to_thread(self._get_converter, options),
+                asyncio.to_thread(fetch_url, url),
+            )
         except Exception as e:
-            timing.total_seconds = time.perf_counter() - start_time
             return ProcessingResult(
                 success=False,
                 error=str(e),
-                timing=timing,
+                timing=ProcessingTiming(total_seconds=time.perf_counter() - start_time),
             )
 
+        source = DocumentStream(name=name, stream=BytesIO(data))
+        return await asyncio.to_thread(self._process_source, source, options)
+
     def process_bytes(
         self,
         data: bytes | BinaryIO,
         filename: str,
         options: ProcessingOptions,
     ) -> ProcessingResult:
-        """Process document from bytes or file-like object."""
-        import tempfile
-        from pathlib import Path
-
-        # Write to temporary file
-        suffix = Path(filename).suffix
-        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-            if isinstance(data, bytes):
-                tmp.write(data)
-            else:
-                tmp.write(data.read())
-            tmp_path = tmp.name
+        """Process document from bytes or file-like object.
 
-        try:
-            return self.process_file(tmp_path, options)
-        finally:
-            # Clean up temp file
-            Path(tmp_path).unlink(missing_ok=True)
+        The content is handed to Docling as an in-memory stream; the
+        filename is only used for format detection.
+        """
+        if isinstance(data, bytes):
+            stream = BytesIO(data)
+        else:
+            # Rewind so a stream the caller already read converts in full, and
+            # copy it so Docling never shares the caller's buffer
+            if data.seekable():
+                data.seek(0)
+            stream = BytesIO(data.read())
+
+        return self._process_source(DocumentStream(name=filename, stream=stream), options)